@@ -43,6 +43,11 @@ class DataVisualizer(QtCore.QObject):
             "species": None,
         }
 
+        # (frame id, column, bins, range) -> (counts, edges, kde)
+        self._hist_cache: Dict[tuple, tuple] = {}
+        # (frame id, column) -> float values without NaN
+        self._numeric_cache: Dict[tuple, np.ndarray] = {}
+
     # --------------------------------------------------------------------- #
     # Public API
     # --------------------------------------------------------------------- #
@@ -55,6 +60,8 @@ class DataVisualizer(QtCore.QObject):
         """Stores data and builds column mapping."""
         self.tree_data = tree_data
         self.log_data = log_data
+        self._hist_cache.clear()
+        self._numeric_cache.clear()
         self._preprocess_data()
         logger.info("Visualizer data set")
 
@@ -176,7 +183,7 @@ class DataVisualizer(QtCore.QObject):
     # helper (변경된 버전)
     # ---------------------------------------------------------------------
     @staticmethod
-    def _hist_df(values: pd.Series,
+    def _hist_df(values: np.ndarray,
              bins: int,
              rng: Optional[Tuple[float, float]]) -> pd.DataFrame:
         counts, edges = np.histogram(values, bins=bins, range=rng)
@@ -186,6 +193,97 @@ class DataVisualizer(QtCore.QObject):
             "count":     counts
         })
 
+    def _values(self, df: pd.DataFrame, col: str) -> np.ndarray:
+        """Numeric values of ``df[col]`` with NaN dropped, coerced once per frame.
+
+        Cached until the next set_data(), so redraws skip the coercion.
+        """
+        key = (id(df), col)
+        arr = self._numeric_cache.get(key)
+        if arr is None:
+            arr = pd.to_numeric(df[col], errors="coerce").to_numpy(
+                dtype=np.float64, na_value=np.nan)
+            arr = self._numeric_cache[key] = arr[~np.isnan(arr)]
+        return arr
+
+    @staticmethod
+    def _kde_counts(values: np.ndarray,
+                    edges: np.ndarray,
+                    points: int = 200) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Gaussian KDE (Scott bandwidth) scaled to histogram counts."""
+        v = np.asarray(values, dtype=float)
+        n = v.size
+        if n < 2:
+            return None
+        sd = v.std(ddof=1)
+        if not sd > 0:
+            return None
+        bw = sd * n ** (-0.2)
+        grid = np.linspace(edges[0], edges[-1], points)
+        dens = np.zeros_like(grid)
+        # 큰 배열은 (points x chunk) 블록으로 나눠 메모리를 제한
+        for off in range(0, n, 8192):
+            z = (grid[:, None] - v[None, off:off + 8192]) / bw
+            dens += np.exp(-0.5 * z * z).sum(axis=1)
+        dens /= bw * np.sqrt(2 * np.pi)
+        return grid, dens * np.diff(edges).mean()
+
+    def _draw_hist(self, ax,
+                   values: np.ndarray,
+                   bins: int,
+                   rng: Optional[Tuple[float, float]],
+                   key: Optional[tuple] = None) -> pd.DataFrame:
+        """Draw a count histogram with a KDE line and return its bin table.
+
+        The bins are computed once with np.histogram.  If ``ax`` still holds
+        the bars and line of a previous call with the same number of bins,
+        those artists are updated in place instead of being recreated.
+        When ``key`` identifies the source column, counts and the KDE curve
+        are memoized per (bins, range) until the next set_data().
+        """
+        memo = None if key is None else (*key, bins, rng)
+        hit = self._hist_cache.get(memo) if memo is not None else None
+        if hit is not None:
+            counts, edges, kde = hit
+        else:
+            counts, edges = np.histogram(values, bins=bins, range=rng)
+            kde = self._kde_counts(values, edges)
+            if memo is not None:
+                self._hist_cache[memo] = (counts, edges, kde)
+        widths = np.diff(edges)
+
+        bars = getattr(ax, "_hist_bars", None)
+        if bars is not None and len(bars) == len(counts) and bars[0] in ax.patches:
+            for patch, x, w, h in zip(bars, edges[:-1], widths, counts):
+                patch.set_x(x)
+                patch.set_width(w)
+                patch.set_height(h)
+        else:
+            if bars is not None and len(bars) and bars[0] in ax.patches:
+                bars.remove()           # bin 수가 바뀌면 이전 막대를 지우고 새로 그림
+            bars = ax.bar(edges[:-1], counts, width=widths, align="edge",
+                          alpha=0.75, edgecolor="white")
+            ax._hist_bars = bars
+
+        line = getattr(ax, "_hist_kde", None)
+        if line is not None and line not in ax.lines:
+            line = None
+        if kde is None:
+            if line is not None:
+                line.set_data([], [])
+        elif line is not None:
+            line.set_data(*kde)
+        else:
+            (ax._hist_kde,) = ax.plot(*kde)
+
+        ax.relim()
+        ax.autoscale_view()
+        return pd.DataFrame({
+            "bin_start": edges[:-1].round(2),
+            "bin_end":   edges[1:].round(2),
+            "count":     counts
+        })
+
     # ---------------------------------------------------------------------
     # 1) DBH distribution
     # ---------------------------------------------------------------------
@@ -201,17 +299,17 @@ class DataVisualizer(QtCore.QObject):
             ax.set_title("DBH data not available")
             return None
 
-        data = tree_df[col].dropna()
-        if data.empty:
+        data = self._values(tree_df, col)
+        if data.size == 0:
             ax.set_title("No valid DBH data")
             return None
 
-        sns.histplot(data, ax=ax, kde=True, bins=bins, binrange=bin_range)
+        df_counts = self._draw_hist(ax, data, bins, bin_range,
+                                    key=(id(tree_df), col))
         ax.set_title("Tree Diameter (DBH) Distribution")
         ax.set_xlabel("DBH (mm)")
         ax.set_ylabel("The number of trees")
 
-        df_counts = self._hist_df(data, bins, rng=bin_range)
         df_counts.columns = ["DBH_bin_start", "DBH_bin_end", "count"]
         return df_counts
 
@@ -230,17 +328,17 @@ class DataVisualizer(QtCore.QObject):
             ax.set_title("Volume data not available")
             return None
 
-        data = tree_df[col].dropna()
-        if data.empty:
+        data = self._values(tree_df, col)
+        if data.size == 0:
             ax.set_title("No valid volume data")
             return None
 
-        sns.histplot(data, ax=ax, kde=True, bins=bins, binrange=bin_range)
+        df_counts = self._draw_hist(ax, data, bins, bin_range,
+                                    key=(id(tree_df), col))
         ax.set_title("Tree Volume Distribution")
         ax.set_xlabel("Volume (dm3)")
         ax.set_ylabel("The number of trees")
 
-        df_counts = self._hist_df(data, bins, rng=bin_range)
         df_counts.columns = ["Volume_bin_start", "Volume_bin_end", "count"]
         return df_counts
 
@@ -260,17 +358,17 @@ class DataVisualizer(QtCore.QObject):
             ax.set_title("Log length data not available")
             return None
 
-        data = log_df[col].dropna()
-        if data.empty:
+        data = self._values(log_df, col)
+        if data.size == 0:
             ax.set_title("No valid log length data")
             return None
 
-        sns.histplot(data, ax=ax, kde=True, bins=bins, binrange=bin_range)
+        df_counts = self._draw_hist(ax, data, bins, bin_range,
+                                    key=(id(log_df), col))
         ax.set_title("Log Length Distribution")
         ax.set_xlabel("Length (cm)")
         ax.set_ylabel("The number of logs")
 
-        df_counts = self._hist_df(data, bins, rng=bin_range)
         df_counts.columns = ["Length_bin_start", "Length_bin_end", "count"]
         return df_counts
 
@@ -292,16 +390,16 @@ class DataVisualizer(QtCore.QObject):
             ax.set_title("Log diameter data not available")
             return None
 
-        top_data = log_df[top_col].dropna()
-        butt_data = log_df[butt_col].dropna()
-        if top_data.empty and butt_data.empty:
+        top_data = self._values(log_df, top_col)
+        butt_data = self._values(log_df, butt_col)
+        if top_data.size == 0 and butt_data.size == 0:
             ax.set_title("No valid log diameter data")
             return None
 
-        if not top_data.empty:
+        if top_data.size:
             sns.histplot(top_data, ax=ax, kde=True, bins=bins,
                         binrange=bin_range, label="Top")
-        if not butt_data.empty:
+        if butt_data.size:
             sns.histplot(butt_data, ax=ax, kde=True, bins=bins,
                         binrange=bin_range, alpha=0.5, label="Butt")
 
@@ -358,13 +456,13 @@ class DataVisualizer(QtCore.QObject):
             ax.set_title("Volume (m3) data not available")
             return None
 
-        data = pd.to_numeric(tree_df["Volume (m3)"], errors="coerce").dropna()
-        sns.histplot(data, ax=ax, kde=True, bins=bins, binrange=bin_range)
+        data = self._values(tree_df, "Volume (m3)")
+        df = self._draw_hist(ax, data, bins, bin_range,
+                             key=(id(tree_df), "Volume (m3)"))
         ax.set_title("Tree Volume Distribution (m³)")
         ax.set_xlabel("Volume (m³)")
         ax.set_ylabel("The number of trees")
 
-        df = self._hist_df(data, bins, rng=bin_range)
         df.columns = ["bin_start", "bin_end", "count"]
         return df
 
@@ -379,13 +477,13 @@ class DataVisualizer(QtCore.QObject):
             ax.set_title("Volume (dl) data not available")
             return None
 
-        data = pd.to_numeric(tree_df["Volume (dm3)"], errors="coerce").dropna()
-        sns.histplot(data, ax=ax, kde=True, bins=bins, binrange=bin_range)
+        data = self._values(tree_df, "Volume (dm3)")
+        df = self._draw_hist(ax, data, bins, bin_range,
+                             key=(id(tree_df), "Volume (dm3)"))
         ax.set_title("Tree Volume Distribution (dl)")
         ax.set_xlabel("Volume (dl)")
         ax.set_ylabel("The number of trees")
 
-        df = self._hist_df(data, bins, rng=bin_range)
         df.columns = ["bin_start", "bin_end", "count"]
         return df
 
@@ -408,16 +506,16 @@ class DataVisualizer(QtCore.QObject):
             ax.set_title(f"{title} data not available")
             return None
 
-        data = pd.to_numeric(log_df[col_name], errors="coerce").dropna()
-        if data.empty:
+        data = self._values(log_df, col_name)
+        if data.size == 0:
             ax.set_title(f"No valid data for {title}")
             return None
 
-        sns.histplot(data, ax=ax, kde=True, bins=bins, binrange=bin_range)
+        df = self._draw_hist(ax, data, bins, bin_range,
+                             key=(id(log_df), col_name))
         ax.set_title(f"{title} Distribution")
         ax.set_xlabel(f"{col_name}")
         ax.set_ylabel("The number of logs")
 
-        df = self._hist_df(data, bins, rng=bin_range)
         df.columns = ["bin_start", "bin_end", "count"]
         return df
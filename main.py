@@ -1,5 +1,5 @@
-import sys, os, time, mmap, chardet
-import folium, tempfile, geopandas as gpd
+import sys, os, time, mmap, hashlib, chardet
+import geopandas as gpd
 from shapely.geometry import Point
 import pandas as pd
 import numpy as np
@@ -12,12 +12,15 @@ import fiona
 from PyQt5 import QtWidgets, QtGui, QtCore
 from PyQt5.QtWebEngineWidgets import QWebEngineView, QWebEngineSettings
 from PyQt5.QtCore import QSettings
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from weakref import WeakValueDictionary
+from operator import attrgetter
 import itertools
 from typing import Optional
 
 # Import custom modules
-from pri_parser import PRIParser
+from pri_parser import PRIParser, is_ascii_safe
 from data_visualizer import DataVisualizer
 
 # ----- GNSS integration imports -----
@@ -46,6 +49,33 @@ except Exception:
     # can gracefully handle the lack of port enumeration.
     serial = None  # type: ignore
 
+# orjson is optional; it only speeds up serialising map points for Leaflet.
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None  # type: ignore
+
+# cchardet (or the faust-cchardet fork, same module name) is optional; it is
+# a C implementation of chardet and is tried first for non-ASCII PRI files.
+try:
+    import cchardet  # type: ignore
+except Exception:
+    cchardet = None  # type: ignore
+
+# charset-normalizer is optional; when present it replaces chardet for
+# encoding detection of non-ASCII PRI files.
+try:
+    from charset_normalizer import from_bytes as cn_from_bytes  # type: ignore
+except Exception:
+    cn_from_bytes = None  # type: ignore
+
+# pyogrio is optional; when present shapefiles are written through it
+# instead of fiona, which is considerably faster for large tree tables.
+try:
+    import pyogrio  # type: ignore
+except Exception:
+    pyogrio = None  # type: ignore
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -53,6 +83,108 @@ logging.basicConfig(
 )
 logger = logging.getLogger('forestNAV_gui')
 
+# Column widths are measured on this many leading rows plus the header.
+COLUMN_SAMPLE_ROWS = 50
+
+# Library files whose parsed raw records (file_cache "openingFile" etc.) are
+# kept in memory; older ones are re-read from disk when opened again.
+RAW_CACHE_SIZE = 16
+_RAW_CACHE_KEYS = ("openingFile", "var_index", "maxNum", "raw_model")
+
+def _fit_columns(view, sample_rows=COLUMN_SAMPLE_ROWS):
+    """Size the columns of a PandasModel/PriFileModel view from a row sample.
+
+    Replaces ``resizeColumnsToContents()``, which stringifies every cell.
+    """
+    model = view.model()
+    if not hasattr(model, "sampleColumn"):
+        return
+    fm = view.fontMetrics()
+    header = view.horizontalHeader()
+    hfm = header.fontMetrics()
+    pad = 16                        # cell margins + sort indicator slack
+    for c in range(model.columnCount()):
+        width = hfm.horizontalAdvance(str(model.headerData(c, QtCore.Qt.Horizontal)))
+        for text in model.sampleColumn(c, sample_rows):
+            width = max(width, fm.horizontalAdvance(text))
+        view.setColumnWidth(c, width + pad)
+
+def _nanmean(series) -> float:
+    """Mean of a column coerced to float64, ignoring NaN/unparseable cells."""
+    arr = pd.to_numeric(series, errors="coerce").to_numpy(dtype=np.float64, copy=False)
+    valid = ~np.isnan(arr)
+    if not valid.any():
+        return float("nan")
+    return float(arr[valid].mean())
+
+# Summary-tab columns shown as mean/min/max (zeros count as missing).
+_SUMMARY_STAT_COLS = {
+    "tree": ("DBH",),
+    "log": (
+        "Diameter (Top mm ob)", "Diameter (Mid mm ob)",
+        "Diameter (Top mm ub)", "Diameter (Mid mm ub)",
+        "Length (cm)", "Physical Length",
+        "Volume (m3sob)", "Volume (m3sub)",
+        "Volume (Var161) in dl", "Volume (Decimal)",
+    ),
+}
+
+def _summary_numbers(kind, df) -> dict:
+    """Numbers shown on the summary tab for a ``"tree"`` or ``"log"`` frame.
+
+    ``stats`` holds mean/min/max of the summary columns from a single
+    ``agg`` call; for tree data ``means`` and ``counts`` hold the
+    coordinate/altitude means and the Stem Type/Species value counts.
+    """
+    cols = [c for c in _SUMMARY_STAT_COLS[kind] if c in df.columns]
+    if cols:
+        num = df[cols].apply(pd.to_numeric, errors="coerce").replace(0, np.nan)
+        stats = num.agg(["mean", "min", "max"])
+    else:
+        stats = pd.DataFrame(index=["mean", "min", "max"])
+    out = {"stats": stats, "means": {}, "counts": {}}
+    if kind == "tree":
+        for c in ("Latitude", "Longitude", "Altitude"):
+            if c in df.columns:
+                out["means"][c] = _nanmean(df[c])
+        for c in ("Stem Type", "Species Number"):
+            if c in df.columns:
+                out["counts"][c] = list(df[c].value_counts().items())
+    return out
+
+def _stat_lines(stats, cols, fmt=".2f", label=None):
+    """Mean/min/max summary line for the first of ``cols`` present in ``stats``."""
+    for col in cols:
+        if col in stats:
+            mean, lo, hi = stats[col]
+            return [f"{label or col}: mean {mean:{fmt}} | min {lo:{fmt}} | max {hi:{fmt}}"]
+    return []
+
+# 요약 탭 체크박스 이름 -> 줄 생성 함수 (tree: (df, summary), log: (df, stats, length 열 이름))
+_TREE_SUMMARY_LINES = {
+    "# of trees": lambda df, s: [f"The number of trees: {len(df)}"],
+    "DBH": lambda df, s: _stat_lines(s["stats"], ["DBH"], label="DBH (mm)"),
+    "Coordinates": lambda df, s: (
+        [f"Coordinates (mean): ({s['means']['Latitude']:.6f}, {s['means']['Longitude']:.6f})"]
+        if {"Latitude", "Longitude"} <= s["means"].keys() else []),
+    "Altitude": lambda df, s: (
+        [f"Altitude (m): mean {s['means']['Altitude']:.2f}"] if "Altitude" in s["means"] else []),
+    "Stem Type": lambda df, s: [f"Stem Type {v}: {n}" for v, n in s["counts"].get("Stem Type", ())],
+    "Species Number": lambda df, s: [f"Species {v}: {n}" for v, n in s["counts"].get("Species Number", ())],
+}
+
+_LOG_SUMMARY_LINES = {
+    "# of logs": lambda df, st, length_col: [f"The number of logs: {len(df)}"],
+    "Diameter ob (Top)": lambda df, st, length_col: _stat_lines(st, ["Diameter (Top mm ob)"]),
+    "Diameter ob (Mid)": lambda df, st, length_col: _stat_lines(st, ["Diameter (Mid mm ob)"]),
+    "Diameter ub (Top)": lambda df, st, length_col: _stat_lines(st, ["Diameter (Top mm ub)"]),
+    "Diameter ub (Mid)": lambda df, st, length_col: _stat_lines(st, ["Diameter (Mid mm ub)"]),
+    "Length (cm)": lambda df, st, length_col: _stat_lines(st, [length_col]),
+    "Volume (m3)": lambda df, st, length_col: _stat_lines(st, ["Volume (m3sob)", "Volume (m3sub)"], ".3f"),
+    "Volume (dl)": lambda df, st, length_col: _stat_lines(st, ["Volume (Var161) in dl"]),
+    "Volume (Decimal)": lambda df, st, length_col: _stat_lines(st, ["Volume (Decimal)"]),
+}
+
 class FlowLayout(QtWidgets.QLayout):
     """A flow layout that arranges child widgets horizontally and wraps them."""
     def __init__(self, parent=None, margin=0, spacing=-1):
@@ -101,60 +233,41 @@ class FlowLayout(QtWidgets.QLayout):
     def _doLayout(self, rect, testOnly):
         x, y = rect.x(), rect.y()
         lineH = 0
+        # sizeHint()/spacing() 는 패스마다 한 번씩만 계산
+        spaceX = spaceY = self.spacing()
         for item in self._items:
-            w = item.widget().sizeHint().width()
-            h = item.widget().sizeHint().height()
-            spaceX = self.spacing()
-            spaceY = self.spacing()
+            size = item.widget().sizeHint()
+            w, h = size.width(), size.height()
             if x + w > rect.right() and lineH > 0:
                 x = rect.x()
                 y += lineH + spaceY
                 lineH = 0
             if not testOnly:
-                item.setGeometry(QtCore.QRect(QtCore.QPoint(x, y), item.widget().sizeHint()))
+                item.setGeometry(QtCore.QRect(QtCore.QPoint(x, y), size))
             x += w + spaceX
             lineH = max(lineH, h)
         return y + lineH - rect.y()
 
 class PriFile:
+    # __slots__: 레코드 수가 수십만 개이므로 인스턴스 __dict__ 를 두지 않음.
+    # type/value 는 valueArr 에서 파생되므로 따로 저장하지 않는다.
+    __slots__ = ("number", "valueArr")
+
     def __init__(self, num, val):
         self.number = num 
-        tokens      = val.strip().split()
-        self.type   = tokens[0] if tokens else ""
-        self.value  = " ".join(tokens[1:])
-        self.valueArr = tokens
+        self.valueArr = val.split()
 
-class PandasModel(QtCore.QAbstractTableModel):
-    def __init__(self, df=pd.DataFrame(), parent=None):
-        super().__init__(parent)
-        self._df = df
+    @property
+    def type(self):
+        return self.valueArr[0] if self.valueArr else ""
 
-    def rowCount(self, parent=None):
-        return self._df.shape[0]
+    @property
+    def value(self):
+        return " ".join(self.valueArr[1:])
 
-    def columnCount(self, parent=None):
-        return self._df.shape[1]
+class _DragCopyMixin:
+    """Drag/copy support shared by the table models; needs ``_cell_text``."""
 
-    def data(self, index, role=QtCore.Qt.DisplayRole):
-        if index.isValid() and role == QtCore.Qt.DisplayRole:
-            value = self._df.iloc[index.row(), index.column()]
-            if isinstance(value, float):
-                return f"{value:.2f}"
-            return str(value)
-        return None
-
-    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
-        if role != QtCore.Qt.DisplayRole:
-            return None
-        if orientation == QtCore.Qt.Horizontal:
-            if 0 <= section < self._df.shape[1]:
-                return str(self._df.columns[section])
-            return ""
-        else:
-            if 0 <= section < self._df.shape[0]:
-                return str(self._df.index[section])
-            return ""
-        
     def flags(self, index):
         default = super().flags(index)
         return default | QtCore.Qt.ItemIsDragEnabled 
@@ -163,20 +276,313 @@ class PandasModel(QtCore.QAbstractTableModel):
         return QtCore.Qt.CopyAction
 
     def mimeData(self, indexes):
-        rows = {}
-        for idx in indexes:
-            rows.setdefault(idx.row(), {})[idx.column()] = str(
-                self._df.iloc[idx.row(), idx.column()]
-            )
-        lines = []
-        for r in sorted(rows):
-            cols = rows[r]
-            line = "\t".join(cols.get(c, "") for c in sorted(cols))
-            lines.append(line)
+        n = len(indexes)
+        rs = np.fromiter((i.row() for i in indexes), dtype=np.int64, count=n)
+        cs = np.fromiter((i.column() for i in indexes), dtype=np.int64, count=n)
+        # (row, col) 를 한 키로 묶어 정렬·중복 제거를 한 번에 처리
+        ncols = max(self.columnCount(), 1)
+        keys = np.unique(rs * ncols + cs)
+        rs, cs = (keys // ncols).tolist(), (keys % ncols).tolist()
+        cells = [self._cell_text(r, c) for r, c in zip(rs, cs)]
+        bounds = [0, *(np.flatnonzero(np.diff(rs)) + 1).tolist(), len(cells)]
+        lines = ["\t".join(cells[a:b]) for a, b in zip(bounds, bounds[1:]) if b > a]
         mime = QtCore.QMimeData()
         mime.setText("\n".join(lines))
         return mime
 
+class _FetchMoreMixin:
+    """Incremental row loading shared by the table models.
+
+    Needs ``_total`` (all rows) and ``_loaded`` (rows shown so far).
+    """
+    # 큰 표는 뷰가 스크롤할 때마다 이 행 수씩 노출한다 (fetchMore)
+    FETCH_ROWS = 1000
+
+    def rowCount(self, parent=None):
+        return self._loaded
+
+    def canFetchMore(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return False
+        return self._loaded < self._total
+
+    def fetchMore(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return
+        add = min(self.FETCH_ROWS, self._total - self._loaded)
+        if add <= 0:
+            return
+        self.beginInsertRows(QtCore.QModelIndex(), self._loaded, self._loaded + add - 1)
+        self._loaded += add
+        self.endInsertRows()
+
+class PriFileModel(_FetchMoreMixin, _DragCopyMixin, QtCore.QAbstractTableModel):
+    """Raw-data view over parsed PRI records, one column per record.
+
+    Cells are read from ``PriFile.valueArr`` on demand, so no padded
+    matrix or DataFrame is built just to display the file.
+    """
+
+    def __init__(self, pri_list=(), max_num=0, parent=None):
+        super().__init__(parent)
+        self._records = pri_list
+        self._total = max_num
+        self._loaded = min(self.FETCH_ROWS, max_num)
+        self._col_labels = [str(pf.number) for pf in pri_list]
+
+    def columnCount(self, parent=None):
+        return len(self._records)
+
+    def _cell_text(self, r, c):
+        arr = self._records[c].valueArr
+        return arr[r] if r < len(arr) else ""
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if role != QtCore.Qt.DisplayRole or not index.isValid():
+            return None
+        return self._cell_text(index.row(), index.column())
+
+    def sampleColumn(self, c, n):
+        return self._records[c].valueArr[:n]
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role != QtCore.Qt.DisplayRole:
+            return None
+        if orientation == QtCore.Qt.Horizontal:
+            if 0 <= section < len(self._col_labels):
+                return self._col_labels[section]
+            return ""
+        if 0 <= section < self._total:
+            return str(section)
+        return ""
+
+class PandasModel(_FetchMoreMixin, _DragCopyMixin, QtCore.QAbstractTableModel):
+    def __init__(self, df=pd.DataFrame(), parent=None):
+        super().__init__(parent)
+        self._set_frame(df)
+
+    def setDataFrame(self, df):
+        """Show ``df`` in this model with a single model reset."""
+        self.beginResetModel()
+        self._set_frame(df)
+        self.endResetModel()
+
+    def _set_frame(self, df):
+        self._df = df
+        self._total = df.shape[0]
+        self._loaded = min(self.FETCH_ROWS, self._total)
+        # 셀마다 iloc 를 호출하지 않도록 열 단위 ndarray 를 한 번만 꺼내 둔다.
+        # 표시 문자열은 처음 그려질 때 열 단위로 한 번 만든다.
+        self._cols = []
+        for c in range(df.shape[1]):
+            col = df.iloc[:, c]
+            numeric = isinstance(col.dtype, np.dtype) and col.dtype.kind in "fiub"
+            # object/datetime 등은 값 그대로 두고 _format_column 에서 변환
+            self._cols.append(col.to_numpy() if numeric else col.to_numpy(dtype=object))
+        self._display = [None] * df.shape[1]
+        self._col_labels = None
+        self._row_labels = None
+
+    @staticmethod
+    def _format_values(col):
+        kind = col.dtype.kind
+        if kind == "f":
+            return np.char.mod("%.2f", col).tolist()
+        if kind == "O":
+            # 섞인 열: float 만 소수 둘째 자리로, 나머지는 str()
+            return [f"{v:.2f}" if isinstance(v, float) else str(v) for v in col.tolist()]
+        return col.astype(str).tolist()
+
+    def _format_column(self, c):
+        disp = self._format_values(self._cols[c])
+        self._display[c] = disp
+        return disp
+
+    def sampleColumn(self, c, n):
+        """Display strings of the first ``n`` rows of column ``c``.
+
+        Used for column sizing; does not format (or cache) the whole column.
+        """
+        disp = self._display[c]
+        if disp is not None:
+            return disp[:n]
+        return self._format_values(self._cols[c][:n])
+
+    def columnCount(self, parent=None):
+        return self._df.shape[1]
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if role != QtCore.Qt.DisplayRole or not index.isValid():
+            return None
+        c = index.column()
+        disp = self._display[c]
+        if disp is None:
+            disp = self._format_column(c)
+        return disp[index.row()]
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role != QtCore.Qt.DisplayRole:
+            return None
+        # 헤더도 스크롤마다 불리므로 pandas Index 대신 문자열 리스트에서 꺼낸다
+        if orientation == QtCore.Qt.Horizontal:
+            labels = self._col_labels
+            if labels is None:
+                labels = self._col_labels = [str(c) for c in self._df.columns]
+        else:
+            labels = self._row_labels
+            if labels is None:
+                labels = self._row_labels = self._df.index.astype(str).tolist()
+        if 0 <= section < len(labels):
+            return labels[section]
+        return ""
+
+    def _cell_text(self, r, c):
+        return str(self._cols[c][r])
+
+# Datasets with more points than this are clustered on the Leaflet map.
+MAP_CLUSTER_THRESHOLD = 500
+
+# Encoding detection only ever looks at the head of the file.
+ENCODING_SAMPLE_BYTES = 256 * 1024
+ENCODING_CHUNK_BYTES  = 8 * 1024
+NORMALIZER_SAMPLE_BYTES = 64 * 1024
+# Candidates charset-normalizer tries first (most PRI files are Western
+# single-byte or UTF-8); other codecs (Shift-JIS, EUC-KR, GBK, ...) are only
+# considered when none of these decodes the sample cleanly.
+NORMALIZER_CODECS = ["utf_8", "ascii", "latin_1", "cp1252"]
+# A Western guess above this chaos (mess) ratio is treated as mojibake.
+NORMALIZER_MAX_CHAOS = 0.1
+
+# Detector results keyed by a digest of the exact sample they were run on.
+_ENCODING_CACHE: dict = {}
+ENCODING_CACHE_SIZE = 256
+
+def _sniff_encoding(buf) -> str:
+    """Guess the text encoding of a PRI buffer from a bounded sample.
+
+    ``buf`` may be ``bytes`` or an ``mmap``; at most ENCODING_SAMPLE_BYTES
+    are inspected.  UTF-8/UTF-16 BOMs and plain 7-bit ASCII (StanForD files
+    are ISO 8859-1 by default) are recognised without running a detector.
+    Otherwise cchardet or charset-normalizer is used if installed, then
+    chardet; that result is cached per sample, so re-opening a file skips
+    detection.
+    """
+    if buf[:3] == b"\xef\xbb\xbf":
+        return "utf-8-sig"
+    if buf[:2] in (b"\xff\xfe", b"\xfe\xff"):
+        return "utf-16"
+    sample = buf[:ENCODING_SAMPLE_BYTES]
+    if b"\x00" not in sample and sample.isascii():
+        return "latin-1"
+
+    key = hashlib.blake2b(sample, digest_size=16).digest()
+    encoding = _ENCODING_CACHE.get(key)
+    if encoding is None:
+        encoding = _detect_encoding(sample)
+        if len(_ENCODING_CACHE) >= ENCODING_CACHE_SIZE:
+            _ENCODING_CACHE.clear()
+        _ENCODING_CACHE[key] = encoding
+    return encoding
+
+def _detect_encoding(sample: bytes) -> str:
+    """Run cchardet or charset-normalizer (if installed), else chardet, on a
+    non-ASCII sample."""
+    if cchardet is not None:
+        # cchardet 은 bytes 만 받는다 (memoryview 등은 복사해서 넘김)
+        encoding = cchardet.detect(bytes(sample)).get("encoding")
+        if encoding:
+            return encoding
+    # NUL 바이트가 있으면 UTF-16 일 수 있으므로 후보를 좁히지 않은 chardet 에 맡김
+    if cn_from_bytes is not None and b"\x00" not in sample:
+        head = sample[:NORMALIZER_SAMPLE_BYTES]
+        best = cn_from_bytes(head, cp_isolation=NORMALIZER_CODECS).best()
+        if best is None or best.chaos > NORMALIZER_MAX_CHAOS:
+            # 서유럽 코덱으로 깔끔히 풀리지 않으면 (CJK 등) 후보 제한 없이 다시
+            best = cn_from_bytes(head).best()
+        if best is not None and best.encoding:
+            return best.encoding
+
+    detector = chardet.UniversalDetector()
+    for off in range(0, len(sample), ENCODING_CHUNK_BYTES):
+        detector.feed(sample[off:off + ENCODING_CHUNK_BYTES])
+        if detector.done:
+            break
+    detector.close()
+    return detector.result.get("encoding") or "utf-8"
+
+# Bytes removed by bytes.strip(); used when trimming records in place.
+_PRI_WHITESPACE = frozenset(b" \t\n\r\x0b\x0c")
+
+def _read_pri_file(filename, progress=None):
+    """Parse ``filename`` into ``(pri_list, maxNum)`` through a read-only mmap.
+
+    ``progress`` (optional) is called with an integer percentage.
+    """
+    pri_list, maxNum = [], 0
+    with open(filename, "rb") as f:
+        if os.fstat(f.fileno()).st_size > 0:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # 처음부터 끝까지 한 번 훑으므로 커널 read-ahead 를 키운다
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                pri_list, maxNum = _parse_pri_records(mm, progress)
+    if progress is not None:
+        progress(100)
+    return pri_list, maxNum
+
+def _parse_pri_records(mm, progress=None):
+    """Split the mapped file on '~' and build one PriFile per record.
+
+    Record boundaries are located with a single NumPy byte scan; key and
+    value spans are then found in place on the buffer, so only those
+    spans are ever copied (by the decode itself).
+    """
+    encoding = _sniff_encoding(mm)
+    buf = mm
+    if not is_ascii_safe(encoding):
+        # UTF-16 등은 '~' 가 한 바이트가 아니므로 UTF-8 로 변환 후 분할
+        buf = str(mm, encoding, "replace").encode("utf-8")
+        encoding = "utf-8"
+
+    arr = np.frombuffer(buf, dtype=np.uint8)
+    tildes = np.flatnonzero(arr == 0x7E)
+    size = arr.size
+    del arr                         # mmap 을 닫기 전에 buffer export 해제
+    starts = np.concatenate(([0], tildes + 1)).tolist()
+    ends = np.concatenate((tildes, [size])).tolist()
+
+    total_records = len(starts)
+    # 레코드 수의 상한을 알고 있으므로 리스트를 미리 잡아 두고 채운다
+    pri_list = [None] * total_records
+    n = 0
+    # 진행률은 바이트 위치 기준 (레코드 크기가 제각각이라 건수로는 고르지 않음).
+    # 정수 % 가 바뀔 때만 보고하고, 큰 파일은 4096 건마다 확인
+    check_mask = 4095 if total_records > 10_000 else 0
+    size = size or 1
+    last_pct = -1
+    with memoryview(buf) as mv:
+        for i, (start, end) in enumerate(zip(starts, ends)):
+            # bytes.strip() 과 같은 범위를 복사 없이 계산
+            while start < end and buf[start] in _PRI_WHITESPACE:
+                start += 1
+            while end > start and buf[end - 1] in _PRI_WHITESPACE:
+                end -= 1
+            sp = buf.find(b" ", start, end)
+            if sp > start:
+                # PriFile splits on any whitespace, so the value's line
+                # breaks need no normalising here.
+                pri_list[n] = PriFile(str(mv[start:sp], encoding, "replace"),
+                                      str(mv[sp + 1:end], encoding, "replace"))
+                n += 1
+            if progress is not None and i & check_mask == 0:
+                pct = start * 100 // size
+                if pct != last_pct:
+                    progress(pct)
+                    last_pct = pct
+    del pri_list[n:]                # 키가 없는 레코드만큼 잘라냄
+    maxNum = max(map(len, map(attrgetter("valueArr"), pri_list)), default=0)
+    return pri_list, maxNum
+
 class FileLoaderThread(QtCore.QThread):
     progressChanged = QtCore.pyqtSignal(int)
     loadingFinished = QtCore.pyqtSignal(list, int)
@@ -187,44 +593,49 @@ class FileLoaderThread(QtCore.QThread):
     
     def run(self):
         try:
-            with open(self.filename, "rb") as f:
-                byteData = f.read()
-            
-            detected = chardet.detect(byteData)
-            encoding = detected.get("encoding")
-            if not encoding:
-                encoding = "utf-8"
-            
-            decodedStr = byteData.decode(encoding, errors="replace")
-            
-            records = decodedStr.split("~")
-            pri_list = []
-            maxNum = 0
-            total_records = len(records)
-            for i, rec in enumerate(records):
-                rec = rec.strip()
-                if rec:
-                    parts = rec.split(" ", 1)
-                    if len(parts) < 2:
-                        continue
-                    priKey = parts[0]
-                    if priKey in ("257", "267"):
-                        priVal = parts[1].strip()
-                    else:
-                        priVal = parts[1].replace("\n", " ") 
-                    pf = PriFile(priKey, priVal)
-                    pri_list.append(pf)
-                    if len(pf.valueArr) > maxNum:
-                        maxNum = len(pf.valueArr)
-                if total_records > 0 and i % 1000 == 0:
-                    progress_percent = int((i / total_records) * 100)
-                    self.progressChanged.emit(progress_percent)
-            self.progressChanged.emit(100)
+            pri_list, maxNum = _read_pri_file(self.filename, self.progressChanged.emit)
             self.loadingFinished.emit(pri_list, maxNum)
         except Exception as e:
             import traceback
             logger.error(f"Error loading file: {e}\n{traceback.format_exc()}")
 
+def _prefetch_file(filename):
+    """Ask the kernel to start reading ``filename`` into the page cache.
+
+    Returns immediately; a no-op where posix_fadvise is unavailable.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(filename, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+# Library preloads run on a bounded pool instead of one QThread per file.
+class PreloadSignals(QtCore.QObject):
+    loaded = QtCore.pyqtSignal(str, list, int)     # filepath, pri_list, maxNum
+    failed = QtCore.pyqtSignal(str)
+
+class PreloadRunnable(QtCore.QRunnable):
+    """Parse one library file on a QThreadPool worker (no progress reporting)."""
+    def __init__(self, filename, signals: PreloadSignals):
+        super().__init__()
+        self.filename = filename
+        self.signals = signals
+
+    def run(self):
+        try:
+            pri_list, maxNum = _read_pri_file(self.filename)
+        except Exception as e:
+            logger.error(f"Error preloading {self.filename}: {e}")
+            self.signals.failed.emit(self.filename)
+            return
+        self.signals.loaded.emit(self.filename, pri_list, maxNum)
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Additional worker thread for downloading map tiles
@@ -291,6 +702,119 @@ class TileDownloadThread(QtCore.QThread):
             # Always emit the finished signal to notify the GUI that the thread is done.
             self.finished.emit()
 
+class AnalyzeThread(QtCore.QThread):
+    """Parse every library file with ``PRIParser`` in the background.
+
+    The parser's own ``progressChanged`` signal keeps reporting progress;
+    each parsed file is handed back through ``fileAnalyzed``, together with
+    its summary-tab numbers, so the GUI thread only builds models and
+    updates the cache.
+    """
+    fileStarted = QtCore.pyqtSignal(str)
+    fileAnalyzed = QtCore.pyqtSignal(str, object, object, object)
+    analysisFinished = QtCore.pyqtSignal()
+
+    def __init__(self, parser, files):
+        super().__init__()
+        self.parser = parser
+        self.files = list(files)
+
+    def run(self) -> None:
+        for fp in self.files:
+            self.fileStarted.emit(fp)
+            try:
+                if not self.parser.parse_file(fp):
+                    continue                # 실패한 파일은 건너뜀
+                tree_df = self.parser.get_tree_data()
+                log_df = self.parser.get_log_data()
+                # 요약 탭 통계도 여기서 미리 계산해 GUI 스레드 작업을 줄인다
+                summary = {"tree": (tree_df, _summary_numbers("tree", tree_df)),
+                           "log":  (log_df, _summary_numbers("log", log_df))}
+                self.fileAnalyzed.emit(fp, tree_df, log_df, summary)
+            except Exception as e:
+                logger.error(f"Analysis failed for {fp}: {e}")
+        self.analysisFinished.emit()
+
+# Files written concurrently by ExportThread (each goes to its own folder).
+EXPORT_WORKERS = 4
+
+class ExportThread(QtCore.QThread):
+    """Write the per-file tree/log CSVs and tree shapefiles in the background.
+
+    ``jobs`` is a list of ``(name, tree_df, log_df)`` tuples collected on the
+    GUI thread; each one is written to ``<base_dir>/<name>_export``, up to
+    EXPORT_WORKERS files at a time.
+    """
+    progressChanged = QtCore.pyqtSignal(int, int)
+    exportFinished = QtCore.pyqtSignal(bool, str)
+
+    def __init__(self, jobs, base_dir: str, default_crs: str):
+        super().__init__()
+        self.jobs = jobs
+        self.base_dir = base_dir
+        self.default_crs = default_crs
+
+    def run(self) -> None:
+        try:
+            total = len(self.jobs)
+            self.progressChanged.emit(0, total)
+            # 파일마다 폴더가 달라 서로 간섭하지 않으므로 shapefile 쓰기(GDAL)와 CSV 를 겹쳐 실행
+            with ThreadPoolExecutor(max_workers=max(1, min(EXPORT_WORKERS, total))) as pool:
+                futures = [pool.submit(self._export_one, *job) for job in self.jobs]
+                try:
+                    for done, fut in enumerate(as_completed(futures), 1):
+                        fut.result()
+                        self.progressChanged.emit(done, total)
+                except Exception:
+                    for fut in futures:
+                        fut.cancel()    # 아직 시작 안 한 파일은 건너뜀
+                    raise
+            self.exportFinished.emit(True, "Export complete.")
+        except Exception as e:
+            logger.error(f"Export failed: {e}")
+            self.exportFinished.emit(False, str(e))
+
+    def _export_one(self, name, tree_df, log_df) -> None:
+        tgt_dir = os.path.join(self.base_dir, f"{name}_export")
+        os.makedirs(tgt_dir, exist_ok=True)
+
+        # 1) Tree CSV
+        if tree_df is not None and not tree_df.empty:
+            # 일반 CSV 저장
+            tree_csv_path = os.path.join(tgt_dir, f"{name}_tree.csv")
+            tree_df.to_csv(tree_csv_path, index=False, chunksize=100_000)
+
+            # GeoDataFrame 을 만들어 좌표계 정보와 함께 shapefile 로 저장 (예시)
+            if {"Latitude", "Longitude"} <= set(tree_df.columns):
+                try:
+                    lon = pd.to_numeric(tree_df["Longitude"], errors="coerce").to_numpy(dtype=np.float64)
+                    lat = pd.to_numeric(tree_df["Latitude"], errors="coerce").to_numpy(dtype=np.float64)
+                    # 좌표가 없는 행은 한 번의 마스크로 제외 (빈 Point 를 만들지 않음)
+                    valid = ~(np.isnan(lon) | np.isnan(lat))
+                    # 모든 행이 유효하면 얕은 복사만 (열 배열은 공유, 원본에 geometry 열이 붙지 않음)
+                    rows = tree_df.copy(deep=False) if valid.all() else tree_df.loc[valid]
+                    gdf = gpd.GeoDataFrame(
+                        rows,
+                        geometry=gpd.points_from_xy(lon[valid], lat[valid]),
+                        crs="EPSG:4326",  # 원본 위도/경도가 WGS84 라 가정
+                        copy=False,
+                    )
+                    # 설정된 기본 CRS 로 변환
+                    if self.default_crs and self.default_crs != "EPSG:4326":
+                        gdf = gdf.to_crs(self.default_crs)
+                    shp_path = os.path.join(tgt_dir, f"{name}_tree.shp")
+                    if pyogrio is not None:
+                        gdf.to_file(shp_path, engine="pyogrio")
+                    else:
+                        gdf.to_file(shp_path)
+                except Exception as e:
+                    logger.warning(f"Could not export tree shapefile for {name}: {e}")
+
+        # 2) Log CSV
+        if log_df is not None and not log_df.empty:
+            log_csv_path = os.path.join(tgt_dir, f"{name}_log.csv")
+            log_df.to_csv(log_csv_path, index=False, chunksize=100_000)
+
 class ExportSettingsDialog(QtWidgets.QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -330,18 +854,31 @@ class MainWindow(QtWidgets.QMainWindow):
         super(MainWindow, self).__init__()
         self.tree_option_checkboxes = []
         self.log_option_checkboxes  = []
+        self._tree_summary_dispatch = {}    # 체크박스 -> _TREE_SUMMARY_LINES 함수
+        self._log_summary_dispatch  = {}
         self.sw_version = "0.12"
         self.setWindowTitle(f"ForestNAV {self.sw_version} - Advanced forestry Systems Lab, Oregon State University")
         icon_path = os.path.join(os.path.dirname(__file__), "icon.png")
         self.setWindowIcon(QtGui.QIcon(icon_path))
         self.resize(1400, 900)
         self.openingFile = []
+        self._var_index = {}
+        self._summary_cache = {}      # "tree"/"log" -> (DataFrame, summary numbers)
+        self._map_points_cache = {}   # file path -> (tree data digest, (points, columns) JSON)
+        self._file_meta = {}          # file path -> (base name, size in KB)
+        # id(DataFrame) -> PandasModel; the model holds the frame, so the id stays valid
+        self._model_cache = WeakValueDictionary()
         self.maxNum = 0
-        self.df = None
         self.settings = QSettings("OSU_AFLab", "ForestNAV")
         
         self.parser = PRIParser()
         self.visualizer = DataVisualizer()
+        # 라이브러리 분석은 한 번에 하나만 (끝날 때까지 Analyze/Export 버튼 잠금)
+        self.analyzeThread = None
+        self._analyzing = False
+        # 내보내기도 한 번에 하나만 (같은 경로에 두 스레드가 동시에 쓰지 않도록)
+        self.exportThread = None
+        self._exporting = False
         
         self.current_file = None
         
@@ -353,8 +890,15 @@ class MainWindow(QtWidgets.QMainWindow):
         
         self.setAcceptDrops(True)
 
-        self.file_cache: Dict[str, Dict[str, Any]] = {}
-        self._preload_threads = {}
+        # 최근 사용 순서 유지 (raw 레코드는 RAW_CACHE_SIZE 개까지만 보관, _trim_file_cache)
+        self.file_cache: Dict[str, Dict[str, Any]] = OrderedDict()
+        # 라이브러리 미리 읽기: 파일 수와 무관하게 스레드 수를 제한 (디스크/GIL 경합 방지)
+        self._preload_pool = QtCore.QThreadPool(self)
+        self._preload_pool.setMaxThreadCount(max(2, QtCore.QThread.idealThreadCount() - 3))
+        self._preload_pending = set()
+        self._preload_signals = PreloadSignals(self)
+        self._preload_signals.loaded.connect(self._on_preload_finished)
+        self._preload_signals.failed.connect(self._preload_pending.discard)
         
     def _create_menu(self):
         menubar = self.menuBar()
@@ -443,6 +987,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.left_panel_layout.addWidget(self.file_info_frame)
 
         self.fileLibrary = []
+        self._library_set = set()   # fileLibrary 중복 검사용 (순서는 리스트가 유지)
         self.file_list_widget = QtWidgets.QListWidget()
         self.file_list_widget.setMaximumHeight(150)
         self.file_list_widget.itemClicked.connect(self.on_library_item_clicked)
@@ -529,6 +1074,18 @@ class MainWindow(QtWidgets.QMainWindow):
         self.parser.progressChanged.connect(self._update_progress)
         self.parser.parsingFinished.connect(self._on_parsing_finished)
 
+        # Tabs are refreshed lazily: analysis only marks them dirty and the
+        # actual update runs when the user switches to the tab.
+        self._tab_updaters = {
+            self.summary_tab:       self._update_summary_tab,
+            self.tree_tab:          self._update_tree_tab,
+            self.log_tab:           self._update_log_tab,
+            self.visualization_tab: self._update_visualization,
+            self.map_tab:           self._update_map_tab,
+        }
+        self._dirty_tabs = set()
+        self.tab_control.currentChanged.connect(self._refresh_current_tab)
+
         # Initially enable only the Raw Data tab and the unified Map tab.
         # When combining the Map and GNSS functionality into a single tab
         # (`self.map_tab`), the legacy `self.gnss_tab` attribute is no longer
@@ -536,9 +1093,7 @@ class MainWindow(QtWidgets.QMainWindow):
         # raw data tab and disable all other tabs until a file is loaded.
         raw_idx = self.tab_control.indexOf(self.raw_data_tab)
         map_idx = self.tab_control.indexOf(self.map_tab)
-        for i in range(self.tab_control.count()):
-            if i != raw_idx and i != map_idx:
-                self.tab_control.setTabEnabled(i, False)
+        self._set_tabs_enabled(lambda i: i in (raw_idx, map_idx))
 
     def _init_summary_tab(self):
         """Initialize summary tab"""
@@ -578,32 +1133,32 @@ class MainWindow(QtWidgets.QMainWindow):
         self.log_summary_layout.addWidget(self.log_summary_text)
         self.summary_layout.addWidget(self.log_summary_frame)
 
+        # 체크박스를 연달아 바꿔도 100 ms 안의 변경은 한 번의 갱신으로 합친다
+        self._summary_timer = QtCore.QTimer(self)
+        self._summary_timer.setSingleShot(True)
+        self._summary_timer.setInterval(100)
+        self._summary_timer.timeout.connect(self._update_summary_tab)
+
         # ── 고정된 체크박스 생성 ─────────────────────────────────────────
         # Tree options
         self.tree_option_checkboxes = []
-        tree_opts = ["# of trees", "DBH", "Coordinates", "Altitude", "Stem Type", "Species Number"]
-        for idx, name in enumerate(tree_opts):
+        for name, fmt in _TREE_SUMMARY_LINES.items():
             cb = QtWidgets.QCheckBox(name)
             cb.setChecked(True)
-            cb.stateChanged.connect(self._update_summary_tab)
+            cb.stateChanged.connect(self._summary_timer.start)
             self.tree_options_frame.layout().addWidget(cb)
             self.tree_option_checkboxes.append(cb)
+            self._tree_summary_dispatch[cb] = fmt
 
         # Log options
         self.log_option_checkboxes = []
-        log_opts = [
-            "# of logs",
-            "Diameter ob (Top)", "Diameter ob (Mid)",
-            "Diameter ub (Top)", "Diameter ub (Mid)",
-            "Length (cm)", "Volume (m3)", "Volume (dl)",
-            "Volume (Decimal)"
-        ]
-        for idx, name in enumerate(log_opts):
+        for name, fmt in _LOG_SUMMARY_LINES.items():
             cb = QtWidgets.QCheckBox(name)
             cb.setChecked(True)
-            cb.stateChanged.connect(self._update_summary_tab)
+            cb.stateChanged.connect(self._summary_timer.start)
             self.log_options_frame.layout().addWidget(cb)
             self.log_option_checkboxes.append(cb)
+            self._log_summary_dispatch[cb] = fmt
 
     def _init_raw_data_tab(self):
         """Initialize raw data tab"""
@@ -612,6 +1167,7 @@ class MainWindow(QtWidgets.QMainWindow):
         
         # Raw 데이터 테이블
         self.raw_data_table = QtWidgets.QTableView()
+        self.raw_data_table.setHorizontalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
         self.raw_data_layout.addWidget(self.raw_data_table)
 
     def _init_tree_tab(self):
@@ -646,9 +1202,23 @@ class MainWindow(QtWidgets.QMainWindow):
             "Diameter ub Mid Distribution",
             "Species Distribution"
         ])
-        self.viz_type_combo.currentIndexChanged.connect(self._update_visualization)
+
+        # 입력을 빠르게 바꿔도 150 ms 안의 변경은 한 번의 다시 그리기로 합친다
+        self._viz_timer = QtCore.QTimer(self)
+        self._viz_timer.setSingleShot(True)
+        self._viz_timer.setInterval(150)
+        self._viz_timer.timeout.connect(self._on_viz_params_changed)
+        self._viz_key = None
+        self._viz_data = None
+        self._viz_labels = []
+
+        self.viz_type_combo.currentIndexChanged.connect(self._viz_timer.start)
         ctrl_bar.addWidget(self.viz_type_combo)
 
+        # 숫자만 입력되도록 검증하고, 파싱한 값은 편집이 끝날 때 한 번만 저장
+        c_locale = QtCore.QLocale.c()
+        c_locale.setNumberOptions(QtCore.QLocale.RejectGroupSeparator)
+        self._bin_values = {"bin_start": None, "bin_end": None, "bin_width": None}
         for label, attr in [("Start", "bin_start"),
                             ("End",   "bin_end"),
                             ("Width", "bin_width")]:
@@ -657,7 +1227,11 @@ class MainWindow(QtWidgets.QMainWindow):
             le = QtWidgets.QLineEdit()
             le.setFixedWidth(80)
             le.setPlaceholderText("auto")
-            le.editingFinished.connect(self._update_visualization)
+            validator = QtGui.QDoubleValidator(le)
+            validator.setLocale(c_locale)
+            le.setValidator(validator)
+            le.editingFinished.connect(lambda attr=attr: self._cache_bin_value(attr))
+            le.editingFinished.connect(self._viz_timer.start)
             setattr(self, f"{attr}_edit", le)
             ctrl_bar.addWidget(le)
 
@@ -678,12 +1252,19 @@ class MainWindow(QtWidgets.QMainWindow):
         splitter = QtWidgets.QSplitter(QtCore.Qt.Vertical)
         plot_frame = QtWidgets.QFrame()
         plot_layout = QtWidgets.QVBoxLayout(plot_frame)
-        self.figure = Figure(figsize=(6, 4), dpi=100)
+        # 레이아웃은 그릴 때 constrained layout 이 맞춘다 (갱신마다 tight_layout 재계산 안 함)
+        self.figure = Figure(figsize=(6, 4), dpi=100, layout="constrained")
         self.canvas = FigureCanvas(self.figure)
+        # 매 갱신마다 subplot 을 새로 만들지 않고 하나의 axes 를 재사용
+        self._viz_ax = self.figure.add_subplot(111)
+        self._viz_ax.set_axis_off()
         plot_layout.addWidget(self.canvas)
         splitter.addWidget(plot_frame)
 
         self.viz_table = QtWidgets.QTableView()
+        # 갱신마다 새 모델을 만들지 않고 같은 모델에 count 표만 갈아 끼운다
+        self._viz_model = PandasModel()
+        self.viz_table.setModel(self._viz_model)
         splitter.addWidget(self.viz_table)
         splitter.setSizes([400, 150])
 
@@ -851,6 +1432,60 @@ class MainWindow(QtWidgets.QMainWindow):
         # Load the map
         self.gnss_map_view.load(QtCore.QUrl.fromLocalFile(self.gnss_map_html_path))
 
+    @staticmethod
+    def _tree_data_digest(tdf):
+        """Content hash of a tree DataFrame (values, index and columns)."""
+        h = hashlib.blake2b(digest_size=16)
+        try:
+            h.update(pd.util.hash_pandas_object(tdf, index=True).values.tobytes())
+        except TypeError:
+            return None             # unhashable cells: never treat as cached
+        h.update(repr(list(tdf.columns)).encode())
+        return h.digest()
+
+    def _build_map_points_json(self, df_coords, tdf):
+        """Return the ``(points, columns)`` JSON passed to ``addDataset``.
+
+        Each point is [lat, lon, tooltip, values]; ``values`` holds the
+        attribute text in ``columns`` order (null when missing) and the
+        popup HTML is assembled from them in the page when it is opened.
+        """
+        ids = [int(t) for t in df_coords["TreeID"].tolist()]
+        # 트리 정보는 한 번에 꺼내 object ndarray 로 순회 (행마다 .loc 금지)
+        try:
+            info = tdf.loc[ids]
+            cols = [str(c) for c in info.columns]
+            values = info.to_numpy(dtype=object)
+            present = info.notna().to_numpy()
+        except Exception:
+            cols, values, present = [], None, None
+        stem_col = (cols.index('Tree ID (Stem Number)')
+                    if 'Tree ID (Stem Number)' in cols else None)
+
+        points = []
+        for i, (lat, lon, tree_idx) in enumerate(zip(df_coords["Latitude"].tolist(),
+                                                     df_coords["Longitude"].tolist(),
+                                                     ids)):
+            if values is None:
+                points.append([lat, lon, f"Tree {tree_idx}", None])
+                continue
+            row, ok = values[i], present[i]
+            # Tooltip uses the stem number if available, otherwise the tree index.
+            if stem_col is not None and ok[stem_col]:
+                tooltip = f"Tree ID (Stem Number): {row[stem_col]}"
+            else:
+                tooltip = f"Tree {tree_idx}"
+            # 열 이름은 데이터셋당 한 번만 보내고, 점마다 값 문자열만 담는다
+            attrs = [str(v) if m else None for v, m in zip(row, ok)] if ok.any() else None
+            points.append([lat, lon, tooltip, attrs])
+        # Serialise points to JSON for injection into JS.
+        try:
+            if orjson is not None:
+                return orjson.dumps(points).decode(), orjson.dumps(cols).decode()
+            return json.dumps(points), json.dumps(cols)
+        except Exception:
+            return '[]', '[]'
+
     def _update_map_tab(self):
         """Update the unified map tab with currently loaded datasets.
 
@@ -870,15 +1505,18 @@ class MainWindow(QtWidgets.QMainWindow):
             if not cache or 'tree_data' not in cache:
                 continue
             tdf = cache['tree_data']
-            if {"Latitude", "Longitude"} - set(tdf.columns):
+            if tdf.columns.intersection(["Latitude", "Longitude"]).size != 2:
                 continue
-            df_coords = (tdf[["Latitude", "Longitude"]]
-                         .dropna().astype(float)
-                         .reset_index(drop=False)
-                         .rename(columns={"index": "TreeID"}))
+            # 변환과 결측 제거를 한 번에 (빈 문자열도 NaN 이 되어 빠짐)
+            lat = pd.to_numeric(tdf["Latitude"], errors="coerce").to_numpy(dtype=np.float64)
+            lon = pd.to_numeric(tdf["Longitude"], errors="coerce").to_numpy(dtype=np.float64)
+            valid = ~(np.isnan(lat) | np.isnan(lon))
+            df_coords = pd.DataFrame({"TreeID": tdf.index[valid],
+                                      "Latitude": lat[valid],
+                                      "Longitude": lon[valid]})
             if df_coords.empty:
                 continue
-            datasets.append((os.path.basename(fp), df_coords, tdf))
+            datasets.append((os.path.basename(fp), df_coords, tdf, fp))
 
         # If no datasets are available, show a message and return without
         # modifying the map.  This leaves any existing dataset layers intact.
@@ -891,9 +1529,12 @@ class MainWindow(QtWidgets.QMainWindow):
         if hasattr(self, 'map_msg'):
             self.map_msg.hide()
 
-        # Compute mean latitude and longitude across all datasets for centering
-        lat_mean = float(np.mean([d[1]["Latitude"].mean() for d in datasets]))
-        lon_mean = float(np.mean([d[1]["Longitude"].mean() for d in datasets]))
+        # Centre on the mean of all points (not the mean of per-file means,
+        # which would over-weight small files)
+        lat_mean = float(np.nanmean(np.concatenate(
+            [d[1]["Latitude"].to_numpy(dtype=np.float64) for d in datasets])))
+        lon_mean = float(np.nanmean(np.concatenate(
+            [d[1]["Longitude"].to_numpy(dtype=np.float64) for d in datasets])))
 
         # Colour palette and cycling iterator for dataset layers
         palette = [
@@ -914,66 +1555,29 @@ class MainWindow(QtWidgets.QMainWindow):
             pass
 
         # Add each dataset as a separate overlay layer.  For each dataset, build
-        # a list of [lat, lon] pairs and then invoke addDataset(name, points, color).
-        for label, df_coords, tdf in datasets:
-            # Use a detailed points list that includes info for popups/tooltips.
-            # Each element is [lat, lon, tooltip, popup].
+        # the points JSON and then invoke addDataset(name, points, color, columns).
+        new_cache = {}
+        for label, df_coords, tdf, fp in datasets:
             color = next(color_cycle)
-            points = []
-            for r in df_coords.itertuples():
-                try:
-                    lat = float(r.Latitude)
-                    lon = float(r.Longitude)
-                except Exception:
-                    continue
-                # Tree index from the DataFrame row; use to lookup full tree info.
-                tree_idx = int(r.TreeID)
-                info_row = None
-                try:
-                    info_row = tdf.loc[tree_idx]
-                except Exception:
-                    info_row = None
-                # Tooltip uses the stem number if available, otherwise the tree index.
-                tooltip = None
-                if info_row is not None:
-                    try:
-                        stem = info_row.get('Tree ID (Stem Number)', None)
-                        if stem is not None and pd.notna(stem):
-                            tooltip = f"Tree ID (Stem Number): {stem}"
-                    except Exception:
-                        pass
-                if tooltip is None:
-                    tooltip = f"Tree {tree_idx}"
-                # Build an HTML popup string with all available attributes.
-                popup = None
-                if info_row is not None:
-                    try:
-                        popup_lines = []
-                        for k, v in info_row.items():
-                            try:
-                                if pd.notna(v):
-                                    popup_lines.append(f"<b>{k}</b>: {v}")
-                            except Exception:
-                                continue
-                        popup = "<br>".join(popup_lines)
-                    except Exception:
-                        popup = None
-                points.append([lat, lon, tooltip, popup])
-            # Serialise points to JSON for injection into JS.
-            try:
-                import json as _json
-                points_json = _json.dumps(points)
-            except Exception:
-                points_json = '[]'
+            # 같은 트리 데이터면 이전에 만든 points JSON 을 재사용
+            key = self._tree_data_digest(tdf)
+            cached = self._map_points_cache.get(fp)
+            if key is not None and cached is not None and cached[0] == key:
+                points_json, columns_json = cached[1]
+            else:
+                points_json, columns_json = self._build_map_points_json(df_coords, tdf)
+            new_cache[fp] = (key, (points_json, columns_json))
             js = (
                 f"if (typeof addDataset === 'function') "
-                f"{{ addDataset('{label}', {points_json}, '{color}'); }}"
+                f"{{ addDataset('{label}', {points_json}, '{color}', {columns_json}); }}"
             )
             try:
                 self.gnss_map_view.page().runJavaScript(js)
             except Exception:
                 pass
 
+        self._map_points_cache = new_cache
+
         # Centre the map on the computed mean location with a reasonable zoom level.
         js_center = (
             f"if (typeof map !== 'undefined' && map.setView) "
@@ -987,96 +1591,6 @@ class MainWindow(QtWidgets.QMainWindow):
         # For export functionality, retain the last computed tree_data
         self._map_df_for_export = getattr(self, 'tree_data', None)
 
-        # At this point the unified map has been updated; return early so that
-        # the original Folium-based implementation is skipped entirely.
-        return
-
-        # ── 1) 데이터 모으기 ─────────────────────────────
-        datasets = []
-        for fp in self.fileLibrary:
-            cache = self.file_cache.get(fp)
-            if not cache or "tree_data" not in cache:
-                continue
-            tdf = cache["tree_data"]
-            if {"Latitude", "Longitude"} - set(tdf.columns):
-                continue
-
-            df_coords = (tdf[["Latitude", "Longitude"]]
-                        .dropna().astype(float)
-                        .reset_index(drop=False)
-                        .rename(columns={"index": "TreeID"}))
-            if df_coords.empty:
-                continue
-            datasets.append((os.path.basename(fp), df_coords, tdf))
-
-        if not datasets:
-            return
-
-        # ── 2) 지도 베이스 생성 (모든 좌표 평균) ─────────────
-        lat_mean = np.mean([d[1]["Latitude"].mean() for d in datasets])
-        lon_mean = np.mean([d[1]["Longitude"].mean() for d in datasets])
-        fmap = folium.Map(location=[lat_mean, lon_mean],
-                        zoom_start=16, tiles="Esri.WorldImagery")
-
-        # ── 3) 컬러 팔레트 준비 ───────────────────────────
-        palette = [
-            "#e6194b", "#3cb44b", "#ffe119", "#4363d8", "#f58231",
-            "#911eb4", "#46f0f0", "#f032e6", "#bcf60c", "#fabebe",
-            "#008080", "#e6beff", "#9a6324", "#fffac8", "#800000",
-            "#aaffc3", "#808000", "#ffd8b1", "#000075", "#808080"
-        ]
-        color_cycle = itertools.cycle(palette)
-
-        # ── 4) 각 데이터셋을 개별 레이어로 추가 ───────────
-        for label, df_coords, tdf in datasets:
-            color = next(color_cycle)
-            feat_grp = folium.FeatureGroup(name=label)
-
-            for _, row in df_coords.iterrows():
-                tree_idx = int(row.TreeID)
-                # popup_html = "<br>".join(
-                #     f"<b>{k}</b>: {v}"
-                #     for k, v in tdf.loc[tree_idx].items() if pd.notna(v)
-                # )
-                # folium.CircleMarker(
-                #     location=(row.Latitude, row.Longitude),
-                #     radius=4, color=color, fill=True,
-                #     fill_color=color, fill_opacity=0.8,
-                #     popup=folium.Popup(popup_html, max_width=300),
-                #     tooltip=f"{label} – Tree {tree_idx}"
-                # ).add_to(feat_grp)
-
-                stem_number = tdf.loc[tree_idx, 'Tree ID (Stem Number)']
-                tooltip_text = f"Tree ID (Stem Number): {stem_number}"
-
-                popup_html = "<br>".join(
-                    f"<b>{k}</b>: {v}"
-                    for k, v in tdf.loc[tree_idx].items() if pd.notna(v)
-                )
-                folium.CircleMarker(
-                    location=(row.Latitude, row.Longitude),
-                    radius=3, color=color, fill=True,
-                    fill_color=color, fill_opacity=0.8,
-                    tooltip=tooltip_text,
-                    popup=folium.Popup(popup_html, max_width=300),
-                ).add_to(feat_grp)
-
-            feat_grp.add_to(fmap)
-
-        # ── 5) 레이어 컨트롤 & 렌더링 ─────────────────────
-        folium.LayerControl().add_to(fmap)
-
-        tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".html")
-        fmap.save(tmp.name)
-        self.map_view.load(QtCore.QUrl.fromLocalFile(tmp.name))
-
-        # 화면 전환
-        self.map_view.show()
-        self.map_msg.hide()
-
-        # 내보내기용 백업 (현재 파일만 우선 저장)
-        self._map_df_for_export = self.tree_data
-
     # ------------------------------------------------------------------
     # GNSS tab helpers and callbacks
     # ------------------------------------------------------------------
@@ -1645,6 +2159,9 @@ class MainWindow(QtWidgets.QMainWindow):
   <meta name="viewport" content="width=device-width, initial-scale=1.0">
   <link rel="stylesheet" href="https://unpkg.com/leaflet@1.7.1/dist/leaflet.css" />
   <script src="https://unpkg.com/leaflet@1.7.1/dist/leaflet.js"></script>
+  <link rel="stylesheet" href="https://unpkg.com/leaflet.markercluster@1.5.3/dist/MarkerCluster.css" />
+  <link rel="stylesheet" href="https://unpkg.com/leaflet.markercluster@1.5.3/dist/MarkerCluster.Default.css" />
+  <script src="https://unpkg.com/leaflet.markercluster@1.5.3/dist/leaflet.markercluster.js"></script>
   <style>
     html, body, #map {{ height: 100%; margin: 0; padding: 0; }}
     /* Style for the auto-center control when active */
@@ -1658,7 +2175,11 @@ class MainWindow(QtWidgets.QMainWindow):
   <div id="map"></div>
   <script>
     // Initialize map and layers
-    var map = L.map('map').setView([{lat0}, {lon0}], 2);
+    // preferCanvas: vector markers are drawn on one <canvas> instead of one
+    // SVG element per tree, which keeps large datasets responsive.
+    var map = L.map('map', {{ preferCanvas: true }}).setView([{lat0}, {lon0}], 2);
+    // Datasets larger than this are clustered (if the plugin loaded).
+    var CLUSTER_THRESHOLD = {MAP_CLUSTER_THRESHOLD};
     // Online satellite imagery layer (Esri World Imagery)
     // Use Esri's World Imagery service as the default base map so users see satellite
     // imagery instead of the standard OpenStreetMap tiles.  The curly braces are
@@ -1708,22 +2229,48 @@ class MainWindow(QtWidgets.QMainWindow):
      * @param {{Array}} points Array of [lat, lon, tooltip, popup] entries
      * @param {{string}} color Hex colour code for markers
      */
-    function addDataset(name, points, color) {{
+    function popupHtml(columns, values) {{
+      var parts = [];
+      for (var k = 0; k < columns.length; k++) {{
+        if (values[k] !== null) {{
+          parts.push('<b>' + columns[k] + '</b>: ' + values[k]);
+        }}
+      }}
+      return parts.join('<br>');
+    }}
+    function addDataset(name, points, color, columns) {{
       // Use a feature group so that we can compute bounds when toggling layers.
-      var layer = L.featureGroup();
+      // Large datasets use a marker cluster group (also a feature group) that
+      // stops clustering once the user zooms in close.
+      var layer;
+      if (points.length > CLUSTER_THRESHOLD && typeof L.markerClusterGroup === 'function') {{
+        layer = L.markerClusterGroup({{ disableClusteringAtZoom: 17, chunkedLoading: true }});
+      }} else {{
+        layer = L.featureGroup();
+      }}
+      var markers = [];
       for (var i = 0; i < points.length; i++) {{
         var pt = points[i];
         var lat = pt[0], lon = pt[1];
         var tooltip = (pt.length > 2 ? pt[2] : null);
-        var popup = (pt.length > 3 ? pt[3] : null);
+        var values = (pt.length > 3 ? pt[3] : null);
         var circle = L.circleMarker([lat, lon], {{ radius: 3, color: color, fillColor: color, fillOpacity: 0.8 }});
         if (tooltip) {{
           circle.bindTooltip(tooltip);
         }}
-        if (popup) {{
-          circle.bindPopup(popup);
+        if (values && columns) {{
+          // The popup HTML is only built when the marker is opened.
+          circle.bindPopup(popupHtml.bind(null, columns, values));
+        }}
+        markers.push(circle);
+      }}
+      // Add all markers in one call so the layer re-renders once.
+      if (layer.addLayers) {{
+        layer.addLayers(markers);
+      }} else {{
+        for (var j = 0; j < markers.length; j++) {{
+          layer.addLayer(markers[j]);
         }}
-        circle.addTo(layer);
       }}
       layer.addTo(map);
       datasetLayers[name] = layer;
@@ -1826,44 +2373,34 @@ class MainWindow(QtWidgets.QMainWindow):
         # Store path for later loading
         self.gnss_map_html_path = html_path
 
-    def _get_bin_params(self):
+    def _cache_bin_value(self, attr):
+        """Store the parsed float of a bin edit; empty text means "auto"."""
+        text = getattr(self, f"{attr}_edit").text().strip()
         try:
-            s = self.bin_start_edit.text().strip()
-            e = self.bin_end_edit.text().strip()
-            w = self.bin_width_edit.text().strip()
-
-            bin_range = None
-            if s and e:
-                start = float(s); end = float(e)
-                if start < end:
-                    bin_range = (start, end)
-
-            bins = None
-            if w:
-                width = float(w)
-                if width > 0:
-                    if bin_range:
-                        span = bin_range[1] - bin_range[0]
-                        bins = max(1, int(round(span / width)))
-                    else:
-                        bins = max(1, int(width))  # 해석: width 입력을 ‘bin 수’로 간주
-            return bin_range, bins
+            self._bin_values[attr] = float(text) if text else None
         except ValueError:
-            return None, None
+            self._bin_values[attr] = None
+
+    def _get_bin_params(self):
+        start = self._bin_values["bin_start"]
+        end   = self._bin_values["bin_end"]
+        width = self._bin_values["bin_width"]
+
+        bin_range = None
+        if start is not None and end is not None and start < end:
+            bin_range = (start, end)
+
+        bins = None
+        if width is not None and width > 0:
+            if bin_range:
+                span = bin_range[1] - bin_range[0]
+                bins = max(1, int(round(span / width)))
+            else:
+                bins = max(1, int(width))  # 해석: width 입력을 ‘bin 수’로 간주
+        return bin_range, bins
 
     def _get_bin_range(self):
-        try:
-            start_txt = self.bin_start_edit.text().strip()
-            end_txt   = self.bin_end_edit.text().strip()
-            if start_txt == "" or end_txt == "":
-                return None
-            start = float(start_txt)
-            end   = float(end_txt)
-            if start >= end:
-                return None
-            return (start, end)
-        except ValueError:
-            return None
+        return self._get_bin_params()[0]
 
     def open_file_dialog(self):
         default_dir = self.settings.value("defaultFilePath", os.getcwd())
@@ -1914,8 +2451,9 @@ class MainWindow(QtWidgets.QMainWindow):
         """Reset all data when loading a new file"""
         # 데이터 초기화
         self.openingFile = []
+        self._var_index = {}
+        self._summary_cache = {}
         self.maxNum = 0
-        self.df = None
         self.tree_data = None
         self.log_data = None
         
@@ -1931,22 +2469,46 @@ class MainWindow(QtWidgets.QMainWindow):
         self.log_table.setModel(empty_model)
         
         # 시각화 초기화
-        self.figure.clear()
-        self.canvas.draw()
+        self._viz_ax.cla()
+        self._viz_ax.set_axis_off()
+        self.canvas.draw_idle()
+        self._viz_key = None
+        self._viz_data = None
+        self._viz_labels = []
         
         # 버튼 상태 초기화
         self.export_button.setEnabled(False)
+        self._dirty_tabs.clear()
 
         raw_idx = self.tab_control.indexOf(self.raw_data_tab)
-        for i in range(self.tab_control.count()):
-            if i != raw_idx:
-                self.tab_control.setTabEnabled(i, False)
+        self._set_tabs_enabled(lambda i: i == raw_idx)
+
+    def _set_tabs_enabled(self, enabled_fn):
+        """Enable tab ``i`` iff ``enabled_fn(i)``, repainting the tab bar once."""
+        # currentChanged 는 막지 않는다: 현재 탭이 꺼지면 옮겨 간 탭의 지연 갱신이 필요
+        tc = self.tab_control
+        tc.setUpdatesEnabled(False)
+        try:
+            for i in range(tc.count()):
+                tc.setTabEnabled(i, enabled_fn(i))
+        finally:
+            tc.setUpdatesEnabled(True)
+
+    def _meta_for(self, filepath):
+        """(base name, size in KB) of ``filepath``, stat'ed once per file."""
+        meta = self._file_meta.get(filepath)
+        if meta is None:
+            meta = self._file_meta[filepath] = (
+                os.path.basename(filepath), os.path.getsize(filepath) / 1024)
+        return meta
 
     def _add_to_library(self, filepath):
-        if filepath in self.fileLibrary:
+        if filepath in self._library_set:
             return
+        self._library_set.add(filepath)
         self.fileLibrary.append(filepath)
-        item = QtWidgets.QListWidgetItem(os.path.basename(filepath))
+        name, _ = self._meta_for(filepath)
+        item = QtWidgets.QListWidgetItem(name)
         item.setData(QtCore.Qt.UserRole, filepath)
         self.file_list_widget.addItem(item)
 
@@ -1960,7 +2522,7 @@ class MainWindow(QtWidgets.QMainWindow):
     # 파일 로딩: QThread와 QProgressDialog 사용
     def load_file(self, filename):
         try:
-            if filename in self.file_cache:
+            if "openingFile" in self.file_cache.get(filename, ()):
                 self.apply_cached_file(filename)
                 return
 
@@ -1970,21 +2532,21 @@ class MainWindow(QtWidgets.QMainWindow):
             self.progressDialog = QtWidgets.QProgressDialog(
                 "Loading file...", "Cancel", 0, 100, self)
             self.progressDialog.setWindowModality(QtCore.Qt.WindowModal)
-            self.progressDialog.setMinimumDuration(0)
-            self.progressDialog.show()
+            # 짧은 로딩에서는 대화상자를 띄우지 않음
+            self.progressDialog.setMinimumDuration(500)
             
             self.loaderThread = FileLoaderThread(filename)
-            self.loaderThread.progressChanged.connect(self.progressDialog.setValue)
+            self.loaderThread.progressChanged.connect(
+                self.progressDialog.setValue, QtCore.Qt.QueuedConnection)
             self.loaderThread.loadingFinished.connect(self.on_file_loaded)
             self.loaderThread.start()
             
             # 파일 정보 업데이트
-            file_name = os.path.basename(filename)
-            file_size = os.path.getsize(filename) / 1024  # KB
+            file_name, file_size = self._meta_for(filename)
             self.file_info_label.setText(f"File: {file_name}\nSize: {file_size:.2f} KB")
             
-            # 분석 버튼 활성화
-            self.analyze_button.setEnabled(True)
+            # 분석 버튼 활성화 (라이브러리 분석 중이면 끝날 때까지 잠금 유지)
+            self.analyze_button.setEnabled(not self._analyzing)
             
             # 상태 표시줄 업데이트
             self.statusBar().showMessage(f"Loading file: {file_name}")
@@ -1992,58 +2554,60 @@ class MainWindow(QtWidgets.QMainWindow):
             QtWidgets.QMessageBox.critical(self, "Error", str(e))
     
     def on_file_loaded(self, pri_list, maxNum):
-        self.openingFile = pri_list
-        self.maxNum = maxNum
-        self.populate_all()
+        filename = self.loaderThread.filename
+        if self.sender() not in (None, self.loaderThread) or filename != self.current_file:
+            return      # 그 사이 다른 파일을 열었으면 늦게 도착한 결과는 버린다
+        pre = self.file_cache.get(filename, {})
+        if "raw_model" in pre:
+            # 로딩 중에 같은 파일의 미리 읽기가 먼저 끝났으면 그 모델을 그대로 쓴다
+            self.openingFile = pre["openingFile"]
+            self.maxNum = pre["maxNum"]
+            self._index_vars()
+            self.raw_data_table.setModel(pre["raw_model"])
+            _fit_columns(self.raw_data_table)
+        else:
+            self.openingFile = pri_list
+            self._index_vars()
+            self.maxNum = maxNum
+            self.populate_all()
         self.setWindowTitle("ForestNAV " + self.sw_version)
         # close the loader dialog and update status
         self.progressDialog.close()
         
-        self.statusBar().showMessage(f"File loaded: {os.path.basename(self.loaderThread.filename)}")
-        raw_model  = PandasModel(self.df)
-        cache = {
+        self.statusBar().showMessage(f"File loaded: {self._meta_for(filename)[0]}")
+        # raw 만 밀려난 파일이면 남아 있는 분석 결과에 다시 합친다
+        cache = self.file_cache.get(self.current_file, {})
+        cache.update({
             "openingFile": self.openingFile,
+            "var_index":   self._var_index,
             "maxNum":      self.maxNum,
-            "df":          self.df,
-            "raw_model":   raw_model
-        }
+            "raw_model":   self.raw_data_table.model()
+        })
         if hasattr(self, "tree_data") and self.tree_data is not None:
             cache.update({
                 "tree_data":  self.tree_data,
                 "log_data":   self.log_data,
-                "tree_model": PandasModel(self.tree_data),
-                "log_model":  PandasModel(self.log_data),
+                "tree_model": self._model_for(self.tree_data),
+                "log_model":  self._model_for(self.log_data),
             })
         self.file_cache[self.current_file] = cache
+        self._trim_file_cache(self.current_file)
+        if "tree_data" in cache and self.tree_data is None:
+            self.apply_cached_file(self.current_file)   # 분석 탭 복원
 
     def _on_auto_clicked(self):
         self.bin_start_edit.clear()
         self.bin_end_edit.clear()
         self.bin_width_edit.clear()
-        self._update_visualization()
+        self._bin_values = dict.fromkeys(self._bin_values)
+        self._viz_timer.start()
 
     def populate_all(self):
         try:
-            max_len = max((len(pf.valueArr) for pf in self.openingFile), default=0)
-
-            matrix = []
-            cols   = []
-            for pf in self.openingFile:
-                arr = list(pf.valueArr)
-                # 패딩
-                if len(arr) < max_len:
-                    arr += [""] * (max_len - len(arr))
-                matrix.append(arr)
-                cols.append(str(pf.number))
-
-            df = pd.DataFrame(matrix).T
-            df.columns = cols
-
-            self.df = df
-            self.raw_data_table.setModel(PandasModel(self.df))
-            self.raw_data_table.resizeColumnsToContents()
+            self.raw_data_table.setModel(PriFileModel(self.openingFile, self.maxNum))
+            _fit_columns(self.raw_data_table)
             self.statusBar().showMessage(
-                f"{self.df.shape[1]} columns × {self.df.shape[0]} rows loaded"
+                f"{len(self.openingFile)} columns × {self.maxNum} rows loaded"
             )
 
         except Exception as e:
@@ -2058,54 +2622,56 @@ class MainWindow(QtWidgets.QMainWindow):
         """Library에 담긴 모든 PRI 파일을 차례로 분석한다."""
         if not self.fileLibrary:
             return
+        if self._analyzing or (self.analyzeThread is not None
+                               and self.analyzeThread.isRunning()):
+            return                          # 이미 분석 중
 
         # UI 상태 잠금
+        self._analyzing = True
         self.analyze_button.setEnabled(False)
+        self.export_button.setEnabled(False)
         self.statusBar().showMessage("Analyzing all datasets…")
         self.progress_bar.setValue(0)
 
-        # ① 잠시 팝업/재귀 호출을 막기 위해 parsingFinished 시그널 해제
-        try:
-            self.parser.parsingFinished.disconnect(self._on_parsing_finished)
-        except TypeError:
-            pass   # 이미 끊겨 있을 수도 있음
-
-        # ② 라이브러리 순회 • 캐시에 누적
-        for fp in self.fileLibrary:
-            self.current_file = fp          # “현재 파일” 포인터 갱신
-            self.statusBar().showMessage(f"Analyzing {os.path.basename(fp)} …")
-
-            ok = self.parser.parse_file(fp)  # ← 동기식 파싱
-            if not ok:
-                continue                    # 실패한 파일은 건너뜀
-
-            tree_df = self.parser.get_tree_data()
-            log_df  = self.parser.get_log_data()
+        # 라이브러리 순회는 작업 스레드 전용 parser 로 • 결과는 GUI 스레드에서 캐시에 누적
+        # (self.parser 의 상태와 parsingFinished 팝업은 건드리지 않음)
+        parser = PRIParser()
+        parser.progressChanged.connect(self._update_progress)
+        self.analyzeThread = AnalyzeThread(parser, self.fileLibrary)
+        self.analyzeThread.fileStarted.connect(
+            lambda fp: self.statusBar().showMessage(f"Analyzing {self._meta_for(fp)[0]} …"))
+        self.analyzeThread.fileAnalyzed.connect(self._on_file_analyzed)
+        self.analyzeThread.analysisFinished.connect(self._on_analysis_finished)
+        self.analyzeThread.start()
+
+    def _on_file_analyzed(self, fp, tree_df, log_df, summary):
+        # 결과는 캐시에만 쌓는다 (보고 있는 파일은 분석 중에 바꾸지 않음)
+        self.file_cache.setdefault(fp, {}).update({
+            "tree_data":  tree_df,
+            "log_data":   log_df,
+            "summary":    summary,
+            "tree_model": self._model_for(tree_df),
+            "log_model":  self._model_for(log_df),
+        })
 
-            cache = self.file_cache.get(fp, {})
-            cache.update({
-                "tree_data":  tree_df,
-                "log_data":   log_df,
-                "tree_model": PandasModel(tree_df),
-                "log_model":  PandasModel(log_df),
-            })
-            self.file_cache[fp] = cache
+    def _on_analysis_finished(self):
+        self._analyzing = False
 
-        # ③ 시그널 복구
-        self.parser.parsingFinished.connect(self._on_parsing_finished)
-
-        # ④ 마지막 파일을 화면에 띄우고, 탭/시각화/지도 업데이트
-        if self.fileLibrary:
-            self.current_file = self.fileLibrary[-1]
-            self.tree_data = self.file_cache[self.current_file]["tree_data"]
-            self.log_data  = self.file_cache[self.current_file]["log_data"]
+        # 보고 있던 파일(없으면 라이브러리의 마지막 파일)의 결과로 탭/시각화/지도 업데이트
+        fp = self.current_file
+        if fp is None and self.fileLibrary:
+            fp = self.fileLibrary[-1]
+        cache = self.file_cache.get(fp, {})
+        if "tree_data" in cache:
+            self.current_file = fp
+            self.tree_data = cache["tree_data"]
+            self.log_data  = cache["log_data"]
+            self._summary_cache.update(cache.get("summary", {}))
             self.visualizer.set_data(self.tree_data, self.log_data)
+            self._update_ui_after_analysis()     # → 모든 탭 다시 그림 (지도 포함)
 
-        self._update_ui_after_analysis()     # → 모든 탭 다시 그림
-        self._update_map_tab()               # → 여러 세트 동시 표기
-
-        # ⑤ UI 복구
-        self.export_button.setEnabled(True)
+        # UI 복구
+        self.export_button.setEnabled(not self._exporting)
         self.analyze_button.setEnabled(True)
         self.statusBar().showMessage("Analysis complete (all files)")
         QtWidgets.QMessageBox.information(
@@ -2117,142 +2683,154 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _on_parsing_finished(self, ok):
         if not ok:
-            QtWidgets.QMessageBox.critical(self,"Error","Parse failed"); self.analyze_button.setEnabled(True); return
+            QtWidgets.QMessageBox.critical(self,"Error","Parse failed"); self.analyze_button.setEnabled(not self._analyzing); return
         self.tree_data = self.parser.get_tree_data(); self.log_data = self.parser.get_log_data()
         self.visualizer.set_data(self.tree_data, self.log_data)
-        for i in range(self.tab_control.count()): self.tab_control.setTabEnabled(i, True)
-        self._update_summary_tab(); self._update_tree_tab(); self._update_log_tab(); self._update_visualization(); self._update_map_tab()
-        self.export_button.setEnabled(True); self.analyze_button.setEnabled(True)
-        self.statusBar().showMessage("Analysis complete")
-        QtWidgets.QMessageBox.information(
-            self,
-            "Analysis",
-            "Analysis complete."
-        )
 
+        # 표 모델은 각 탭이 처음 보일 때 만들어지므로 여기서는 데이터만 캐시
         cache = self.file_cache.get(self.current_file, {})
         cache.update({
             "tree_data":  self.tree_data,
             "log_data":   self.log_data,
-            "tree_model": PandasModel(self.tree_data),
-            "log_model":  PandasModel(self.log_data),
         })
         self.file_cache[self.current_file] = cache
+
+        self._update_ui_after_analysis()     # 보이는 탭만 즉시 갱신
+        self.statusBar().showMessage("Analysis complete")
+        QtWidgets.QMessageBox.information(
+            self,
+            "Analysis",
+            "Analysis complete."
+        )
     
     def _update_ui_after_analysis(self):
-        for i in range(self.tab_control.count()):
-            self.tab_control.setTabEnabled(i, True)
-
-        self._update_summary_tab()
-        self._update_tree_tab()
-        self._update_log_tab()
-        self._update_visualization()
-        self._update_map_tab()
+        self._set_tabs_enabled(lambda i: True)
+
+        # 모든 탭을 dirty 로 표시하고, 현재 보이는 탭만 즉시 갱신
+        self._dirty_tabs = set(self._tab_updaters)
+        self._refresh_current_tab()
         
-        self.export_button.setEnabled(True)
+        # 분석/내보내기 중에는 _on_analysis_finished / _on_export_finished 가 버튼을 되살린다
+        self.export_button.setEnabled(not (self._analyzing or self._exporting))
         
-        self.analyze_button.setEnabled(True)
+        self.analyze_button.setEnabled(not self._analyzing)
 
-    def _find_var(self, var_no:str, default="N/A"):
+    def _index_vars(self):
+        """Build the variable-number -> value lookup used by _find_var."""
+        index = {}
         for pf in self.openingFile:
-            if str(pf.number) == var_no:
-                return pf.value
-        return default
+            # first occurrence wins; later duplicates never build their value
+            if pf.number not in index:
+                index[pf.number] = pf.value
+        self._var_index = index
+
+    def _refresh_current_tab(self, *args):
+        """Run the pending update for the visible tab, if it is dirty."""
+        tab = self.tab_control.currentWidget()
+        if tab in self._dirty_tabs:
+            self._dirty_tabs.discard(tab)
+            self._tab_updaters[tab]()
+
+    def _find_var(self, var_no:str, default="N/A"):
+        return self._var_index.get(var_no, default)
     
+    def _summary_stats(self, kind, df):
+        """Summary-tab numbers for ``df`` (see _summary_numbers), once per frame.
+
+        Checkbox toggles only format these cached values.  Frames analysed
+        by AnalyzeThread arrive with their numbers already computed.
+        """
+        cached = self._summary_cache.get(kind)
+        if cached is not None and cached[0] is df:
+            return cached[1]
+        out = _summary_numbers(kind, df)
+        self._summary_cache[kind] = (df, out)
+        return out
+
     def _update_summary_tab(self, *args):
-        info = self.parser.get_file_info()
-        fs = f"File: {info['file_name']}\nSize: {info['file_size']:.2f} KB\nSoftware: {self._find_var('5')}"
+        self._summary_timer.stop()
+        # 분석은 작업 스레드의 parser 가 하므로 파일 정보는 현재 파일에서 직접 얻는다
+        name, size_kb = self._meta_for(self.current_file) if self.current_file else ("", 0)
+        fs = f"File: {name}\nSize: {size_kb:.2f} KB\nSoftware: {self._find_var('5')}"
         self.file_summary_text.setText(fs)
 
         td = self.tree_data
         if td is None or td.empty:
             self.tree_summary_text.setText("No tree data.")
         else:
+            summary = self._summary_stats("tree", td)
             lines = []
-            for cb in self.tree_option_checkboxes:
-                if not cb.isChecked(): continue
-                name = cb.text()
-                if name == "# of trees":
-                    lines.append(f"The number of trees: {len(td)}")
-                elif name == "DBH" and "DBH" in td.columns:
-                    s = td["DBH"].astype(float).replace(0, np.nan).dropna()
-                    lines.append(f"DBH (mm): mean {s.mean():.2f} | min {s.min():.2f} | max {s.max():.2f}")
-                elif name == "Coordinates" and {"Latitude","Longitude"}<=set(td.columns):
-                    lat = td["Latitude"].astype(float).dropna()
-                    lon = td["Longitude"].astype(float).dropna()
-                    lines.append(f"Coordinates (mean): ({lat.mean():.6f}, {lon.mean():.6f})")
-                elif name == "Altitude" and "Altitude" in td.columns:
-                    s = td["Altitude"].astype(float).dropna()
-                    lines.append(f"Altitude (m): mean {s.mean():.2f}")
-                elif name == "Stem Type" and "Stem Type" in td.columns:
-                    for val,cnt in td["Stem Type"].value_counts().items():
-                        lines.append(f"Stem Type {val}: {cnt}")
-                elif name == "Species Number" and "Species Number" in td.columns:
-                    for val,cnt in td["Species Number"].value_counts().items():
-                        lines.append(f"Species {val}: {cnt}")
+            for cb, fmt in self._tree_summary_dispatch.items():
+                if cb.isChecked():
+                    lines += fmt(td, summary)
             self.tree_summary_text.setText("\n".join(lines) or "Please select at least one field.")
 
         ld = self.log_data
         if ld is None or ld.empty:
             self.log_summary_text.setText("No log data.")
         else:
+            length_col = self.visualizer.column_mapping["length"]
+            stats = self._summary_stats("log", ld)["stats"]
             lines = []
-            for cb in self.log_option_checkboxes:
-                if not cb.isChecked(): continue
-                name = cb.text()
-                if name == "# of logs":
-                    lines.append(f"The number of logs: {len(ld)}")
-                elif name.startswith("Diameter ob") or name.startswith("Diameter ub"):
-                    side = "ob" if "ob" in name else "ub"
-                    pos  = "Top" if "Top" in name else "Mid"
-                    col  = f"Diameter ({pos} mm {side})"
-                    if col in ld.columns:
-                        s = ld[col].astype(float).replace(0, np.nan).dropna()
-                        lines.append(f"{col}: mean {s.mean():.2f} | min {s.min():.2f} | max {s.max():.2f}")
-                elif name == "Length (cm)":
-                    col = self.visualizer.column_mapping["length"]
-                    if col in ld.columns:
-                        s = ld[col].astype(float).replace(0, np.nan).dropna()
-                        lines.append(f"{col}: mean {s.mean():.2f} | min {s.min():.2f} | max {s.max():.2f}")
-                elif name == "Volume (m3)":
-                    for c in ["Volume (m3sob)", "Volume (m3sub)"]:
-                        if c in ld.columns:
-                            s = ld[c].astype(float).replace(0, np.nan).dropna()
-                            lines.append(f"{c}: mean {s.mean():.3f} | min {s.min():.3f} | max {s.max():.3f}")
-                            break
-                elif name == "Volume (dl)":
-                    col = "Volume (Var161) in dl"
-                    if col in ld.columns:
-                        s = ld[col].astype(float).replace(0, np.nan).dropna()
-                        lines.append(f"{col}: mean {s.mean():.2f} | min {s.min():.2f} | max {s.max():.2f}")
-                
-                elif name == "Volume (Decimal)":
-                    col = "Volume (Decimal)"
-                    if col in ld.columns:
-                        s = ld[col].astype(float).replace(0, np.nan).dropna()
-                        lines.append(f"{col}: mean {s.mean():.2f} | min {s.min():.2f} | max {s.max():.2f}")
-                        
+            for cb, fmt in self._log_summary_dispatch.items():
+                if cb.isChecked():
+                    lines += fmt(ld, stats, length_col)
             self.log_summary_text.setText("\n".join(lines) or "Please select at least one field.")
     
+    def _model_for(self, df):
+        """The PandasModel for ``df``, reused while any view or cache holds it."""
+        model = self._model_cache.get(id(df))
+        if model is None:
+            model = self._model_cache[id(df)] = PandasModel(df)
+        return model
+
+    def _show_frame(self, table, df):
+        # 같은 DataFrame 이면 모델(표시 문자열·fetchMore 상태 포함)을 그대로 둔다
+        model = self._model_for(df)
+        if table.model() is not model:
+            table.setModel(model)
+            _fit_columns(table)
+
     def _update_tree_tab(self):
         """Update tree data tab"""
         if self.tree_data is not None and not self.tree_data.empty:
-            model = PandasModel(self.tree_data)
-            self.tree_table.setModel(model)
-            self.tree_table.resizeColumnsToContents()
+            self._show_frame(self.tree_table, self.tree_data)
     
     def _update_log_tab(self):
         """Update log data tab"""
         if self.log_data is not None and not self.log_data.empty:
-            model = PandasModel(self.log_data)
-            self.log_table.setModel(model)
-            self.log_table.resizeColumnsToContents()
+            self._show_frame(self.log_table, self.log_data)
+
+    def _viz_state_key(self):
+        bin_range, bins = self._get_bin_params()
+        return (self.viz_type_combo.currentText(), bin_range, bins,
+                id(self.tree_data), id(self.log_data))
+
+    def _on_viz_params_changed(self):
+        """Debounced handler: redraw only if the plot inputs actually changed."""
+        if self._viz_state_key() != self._viz_key:
+            self._update_visualization()
 
     def _update_visualization(self):
-        if hasattr(self, "figure"):
-            self.figure.clear()
-            self.canvas.draw()
-        ax = self.figure.add_subplot(111)
+        self._viz_timer.stop()
+        # 다른 탭을 보고 있으면 그리지 않고, 탭이 보일 때 _refresh_current_tab 이 다시 호출
+        if self.tab_control.currentWidget() is not self.visualization_tab:
+            self._dirty_tabs.add(self.visualization_tab)
+            return
+        prev_key, self._viz_key = self._viz_key, self._viz_state_key()
+        # 키의 id() 가 다른 객체에 재사용되지 않도록 그린 데이터를 붙잡아 둔다
+        self._viz_data = (self.tree_data, self.log_data)
+        ax = self._viz_ax
+        # 같은 데이터·같은 플롯에서 bin 설정만 바뀌었으면 막대/KDE 아티스트를
+        # 그대로 두고 값만 갱신한다 (plot_* 가 ax 의 기존 아티스트를 재사용)
+        if (prev_key is None or prev_key[0] != self._viz_key[0]
+                or prev_key[3:] != self._viz_key[3:]
+                or self._viz_key[0] == "Species Distribution"):
+            ax.cla()
+        else:
+            for label in self._viz_labels:
+                label.remove()
+        self._viz_labels = []
 
         viz_type  = self.viz_type_combo.currentText()
         bin_range, bins_override = self._get_bin_params()
@@ -2298,26 +2876,29 @@ class MainWindow(QtWidgets.QMainWindow):
             ax.set_ylabel("The number of logs")
 
         if counts_df is not None:
-            self.viz_table.setModel(PandasModel(counts_df))
-            self.viz_table.resizeColumnsToContents()
+            self._viz_model.setDataFrame(counts_df)
+            _fit_columns(self.viz_table)
         else:
-            self.viz_table.setModel(PandasModel(pd.DataFrame()))
+            self._viz_model.setDataFrame(pd.DataFrame())
         
-        for patch in ax.patches:
-            height = patch.get_height()
-            if height is not None and height > 0:
-                x = patch.get_x() + patch.get_width() / 2
-                ax.text(x, height, f"{int(height)}",
-                        ha='center', va='bottom')
-            
-        self.figure.tight_layout()
-        self.canvas.draw()
+        # 막대 높이 라벨은 plot_* 가 이미 계산한 count 값을 그대로 사용
+        if counts_df is not None and not counts_df.empty and ax.containers:
+            counts = pd.to_numeric(counts_df.iloc[:, -1], errors="coerce").fillna(0).to_numpy()
+            bars = ax.containers[0]
+            if len(bars) == len(counts):
+                self._viz_labels = ax.bar_label(
+                    bars, labels=[f"{int(c)}" if c > 0 else "" for c in counts])
+
+        self.canvas.draw_idle()
     
     def export_results(self):
         """Export analysis results for all loaded PRI files"""
         if not self.fileLibrary:
             QtWidgets.QMessageBox.information(self, "Info", "No files to export.")
             return
+        if self._exporting or (self.exportThread is not None
+                               and self.exportThread.isRunning()):
+            return                          # 이전 내보내기가 아직 진행 중
 
         # 최상위 내보내기 폴더 선택 (기본 경로는 이전에 저장된 defaultFilePath 사용)
         default_export_dir = self.settings.value("defaultFilePath", os.getcwd())
@@ -2333,56 +2914,44 @@ class MainWindow(QtWidgets.QMainWindow):
         # 기본 좌표계 불러오기 (없으면 EPSG:4326 로 간주)
         default_crs = self.settings.value("defaultExportCRS", "EPSG:4326")
 
+        # 캐시에서 파일별 데이터를 모아 쓰기는 별도 스레드에서 처리
+        jobs = []
         for fp in self.fileLibrary:
             name = os.path.splitext(os.path.basename(fp))[0]
-            tgt_dir = os.path.join(base_dir, f"{name}_export")
-            os.makedirs(tgt_dir, exist_ok=True)
-
-            # 캐시에서 해당 파일의 데이터 가져오기
             cache = self.file_cache.get(fp, {})
-            tree_df = cache.get("tree_data")
-            log_df  = cache.get("log_data")
-
-            # 1) Tree CSV
-            if tree_df is not None and not tree_df.empty:
-                # 일반 CSV 저장
-                tree_csv_path = os.path.join(tgt_dir, f"{name}_tree.csv")
-                tree_df.to_csv(tree_csv_path, index=False)
-
-                # GeoDataFrame 을 만들어 좌표계 정보와 함께 shapefile 로 저장 (예시)
-                if {"Latitude", "Longitude"} <= set(tree_df.columns):
-                    try:
-                        gdf = gpd.GeoDataFrame(
-                            tree_df.copy(),
-                            geometry=gpd.points_from_xy(
-                                tree_df["Longitude"].astype(float),
-                                tree_df["Latitude"].astype(float)
-                            ),
-                            crs="EPSG:4326"  # 원본 위도/경도가 WGS84 라 가정
-                        )
-                        # 설정된 기본 CRS 로 변환
-                        if default_crs and default_crs != "EPSG:4326":
-                            gdf = gdf.to_crs(default_crs)
-                        shp_path = os.path.join(tgt_dir, f"{name}_tree.shp")
-                        gdf.to_file(shp_path)
-                    except Exception as e:
-                        logger.warning(f"Could not export tree shapefile for {name}: {e}")
+            jobs.append((name, cache.get("tree_data"), cache.get("log_data")))
 
-            # 2) Log CSV
-            if log_df is not None and not log_df.empty:
-                log_csv_path = os.path.join(tgt_dir, f"{name}_log.csv")
-                log_df.to_csv(log_csv_path, index=False)
-
-        QtWidgets.QMessageBox.information(self, "Export", "Export complete.")
+        self._exporting = True
+        self.export_button.setEnabled(False)
+        self.statusBar().showMessage("Exporting results…")
+        self.exportThread = ExportThread(jobs, base_dir, default_crs)
+        self.exportThread.progressChanged.connect(
+            lambda cur, tot: self.statusBar().showMessage(f"Exporting results… ({cur}/{tot})"))
+        self.exportThread.exportFinished.connect(self._on_export_finished)
+        self.exportThread.start()
+
+    def _on_export_finished(self, ok, message):
+        self._exporting = False
+        self.export_button.setEnabled(not self._analyzing)
+        self.statusBar().showMessage(message if ok else "Export failed")
+        if ok:
+            QtWidgets.QMessageBox.information(self, "Export", message)
+        else:
+            QtWidgets.QMessageBox.critical(self, "Export Error", message)
     
     def export_file(self):
         try:
-            if self.df is None or self.df.empty:
+            if not self.openingFile:
                 QtWidgets.QMessageBox.information(self, "Info", "Please open a PRI File first.")
                 return
             fname, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Export CSV", "", "CSV Files (*.csv)")
             if fname:
-                self.df.to_csv(fname, index=False)
+                # 레코드마다 한 열: DataFrame 없이 valueArr 를 행 단위로 바로 기록
+                with open(fname, "w", newline="", encoding="utf-8") as f:
+                    writer = csv.writer(f, lineterminator=os.linesep)
+                    writer.writerow([pf.number for pf in self.openingFile])
+                    writer.writerows(itertools.zip_longest(
+                        *(pf.valueArr for pf in self.openingFile), fillvalue=""))
                 QtWidgets.QMessageBox.information(self, "Info", "Export Completed")
         except Exception as e:
             QtWidgets.QMessageBox.critical(self, "Error", str(e))
@@ -2412,78 +2981,86 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def apply_cached_file(self, filepath):
         cache = self.file_cache[filepath]
+        self._trim_file_cache(filepath)
 
         # --- 핵심 데이터 복원 -------------------------------------------
         self.current_file = filepath
         self.openingFile  = cache["openingFile"]
+        # 미리 읽어 둔 파일은 처음 열 때 한 번만 인덱스를 만든다
+        if "var_index" not in cache:
+            self._index_vars()
+            cache["var_index"] = self._var_index
+        self._var_index   = cache["var_index"]
         self.maxNum       = cache["maxNum"]
-        self.df           = cache["df"]
 
         # --- Raw Data 탭 -------------------------------------------------
         self.raw_data_table.setModel(cache.get("raw_model")
-                                 or PandasModel(self.df))
-        self.raw_data_table.resizeColumnsToContents()
+                                 or PriFileModel(self.openingFile, self.maxNum))
+        _fit_columns(self.raw_data_table)
 
         if "tree_data" in cache and "log_data" in cache:
             self.tree_data = cache["tree_data"]
             self.log_data  = cache["log_data"]
+            self._summary_cache.update(cache.get("summary", {}))
 
-            # ▸ 모델이 없으면 즉석에서 만들어 꽂아 줍니다.
-            self.tree_table.setModel(cache.get("tree_model")
-                                    or PandasModel(self.tree_data))
-            self.log_table.setModel (cache.get("log_model")
-                                    or PandasModel(self.log_data))
+            # ▸ 캐시에 보관된 모델을 그대로 꽂아 줍니다 (없으면 새로 만듦).
+            self._show_frame(self.tree_table, self.tree_data)
+            self._show_frame(self.log_table, self.log_data)
 
             self.visualizer.set_data(self.tree_data, self.log_data)
             self._update_ui_after_analysis()
         else:
             # 아직 분석 전인 파일이면 Raw Data 탭만 살려 둡니다.
             raw_idx = self.tab_control.indexOf(self.raw_data_tab)
-            for i in range(self.tab_control.count()):
-                self.tab_control.setTabEnabled(i, i == raw_idx)
-            self.analyze_button.setEnabled(True)
+            self._set_tabs_enabled(lambda i: i == raw_idx)
+            self.analyze_button.setEnabled(not self._analyzing)
 
         # --- 상태바·파일 정보 -------------------------------------------
-        size_kb = os.path.getsize(filepath) / 1024
+        name, size_kb = self._meta_for(filepath)
         self.file_info_label.setText(
-            f"File: {os.path.basename(filepath)}\nSize: {size_kb:.2f} KB"
+            f"File: {name}\nSize: {size_kb:.2f} KB"
         )
-        self.statusBar().showMessage(f"Loaded from cache: {os.path.basename(filepath)}")
+        self.statusBar().showMessage(f"Loaded from cache: {name}")
 
     def _preload_file(self, filepath: str):
         """파일을 미리 파싱해 cache 에 넣는다(진행바 없이)."""
-        if filepath in self.file_cache or filepath in self._preload_threads:
+        if filepath in self.file_cache or filepath in self._preload_pending:
             return                      # 이미 끝났거나 진행 중
-        th = FileLoaderThread(filepath)
-        th.loadingFinished.connect(
-            lambda pri, mx, fp=filepath: self._on_preload_finished(fp, pri, mx)
-        )
-        th.start()
-        self._preload_threads[filepath] = th
+        self._preload_pending.add(filepath)
+        # 풀에서 차례를 기다리는 동안 커널이 미리 읽어 두도록 알림
+        _prefetch_file(filepath)
+        self._preload_pool.start(PreloadRunnable(filepath, self._preload_signals))
 
     def _on_preload_finished(self, filepath, pri_list, max_num):
-        # populate_all()과 동일한 방식으로 DataFrame 생성
-        max_len = max((len(p.valueArr) for p in pri_list), default=0)
-        matrix, cols = [], []
-        for p in pri_list:
-            arr = list(p.valueArr) + [""] * (max_len - len(p.valueArr))
-            matrix.append(arr)
-            cols.append(str(p.number))
-        df = pd.DataFrame(matrix).T
-        df.columns = cols
-
-        # 캐시에 통째로 보관(PandasModel까지)
-        self.file_cache[filepath] = {
-            "openingFile": pri_list,
-            "maxNum":      max_num,
-            "df":          df,
-            "raw_model":   PandasModel(df),
-        }
+        # populate_all()과 같은 raw 모델을 캐시에 보관 (DataFrame 은 만들지 않음).
+        # 먼저 끝난 분석 결과가 있을 수 있으므로 기존 항목에 합친다
+        self._preload_pending.discard(filepath)
+        cache = self.file_cache.setdefault(filepath, {})
+        if "openingFile" not in cache:      # 직접 연 파일이 이미 raw 를 채웠으면 그대로 둠
+            cache.update({
+                "openingFile": pri_list,
+                "maxNum":      max_num,
+                "raw_model":   PriFileModel(pri_list, max_num),
+            })
+        self._trim_file_cache(filepath)
+
+    def _trim_file_cache(self, filepath):
+        """Mark ``filepath`` most recently used and drop the oldest raw records.
 
-        # 스레드 정리
-        th = self._preload_threads.pop(filepath, None)
-        if th:
-            th.deleteLater()
+        Only the raw layer (_RAW_CACHE_KEYS) is evicted beyond RAW_CACHE_SIZE;
+        analysis results stay, since export and the map read them for every
+        library file.  The current file is never evicted.
+        """
+        self.file_cache.move_to_end(filepath)
+        raw = [fp for fp, c in self.file_cache.items() if "openingFile" in c]
+        for fp in raw[:max(0, len(raw) - RAW_CACHE_SIZE)]:
+            if fp == self.current_file:
+                continue
+            cache = self.file_cache[fp]
+            for k in _RAW_CACHE_KEYS:
+                cache.pop(k, None)
+            if not cache:
+                del self.file_cache[fp]
 
     def show_file_path_settings(self):
         current_dir = self.settings.value("defaultFilePath", os.getcwd())
@@ -2523,9 +3100,15 @@ if __name__ == "__main__":
     splash = QtWidgets.QSplashScreen(splash_pix)
     splash.show()
     QtWidgets.qApp.processEvents()
-    time.sleep(2)
+    splash_start = time.monotonic()
 
+    # 스플래시를 띄운 채로 MainWindow 를 만들고, 남은 시간만 이벤트 루프에서 기다림
     window = MainWindow()
-    window.show()
-    splash.finish(window)
+    remaining = max(0, int(2000 - (time.monotonic() - splash_start) * 1000))
+
+    def _show_main():
+        window.show()
+        splash.finish(window)
+
+    QtCore.QTimer.singleShot(remaining, _show_main)
     sys.exit(app.exec_())
@@ -1,17 +1,33 @@
-import os, chardet
-import folium, tempfile
+import os, mmap, codecs, chardet
 import pandas as pd
 import numpy as np
 import logging
 from typing import Dict, List, Tuple, Optional, Any, Union
 from PyQt5 import QtCore
 
+# cchardet is optional; it is a C implementation of chardet's detect().
+try:
+    import cchardet  # type: ignore
+except Exception:
+    cchardet = None  # type: ignore
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger('pri_parser')
 
+_ASCII_SAFE_CODECS = ("ascii", "utf-8", "iso8859", "cp125", "mac-", "koi8")
+
+def is_ascii_safe(encoding: str) -> bool:
+    """True if ``encoding`` never uses the bytes of '~' or ' ' inside a
+    multi-byte sequence, so records can be split on raw bytes."""
+    try:
+        name = codecs.lookup(encoding).name
+    except LookupError:
+        return False
+    return name.startswith(_ASCII_SAFE_CODECS)
+
 class StanForDVariable:
     """Class representing a StanForD variable"""
     
@@ -103,6 +119,9 @@ class PRIParser(QtCore.QObject):
         "772" : "Number of log",
         "2001": "Reserved"
     }
+
+    # Log header/data and tree header/data records; everything else is skipped.
+    TABLE_VARS = (256, 257, 266, 267)
     
     def __init__(self):
         """Initialize PRI parser"""
@@ -113,6 +132,10 @@ class PRIParser(QtCore.QObject):
         self.log_header = []
         self.log_raw_data = []
 
+        # Rows built by parse_file, reused by get_tree_data/get_log_data.
+        self._tree_rows = None
+        self._log_rows = None
+
         self.log_header_map  = PRIParser.LOG_HEADER_MAP
         self.tree_header_map = PRIParser.TREE_HEADER_MAP
 
@@ -183,54 +206,100 @@ class PRIParser(QtCore.QObject):
 
         return rows
 
+    def _take_segment(self, segment: str) -> None:
+        """Store the tokens of one '~'-delimited record if it is a header/data record."""
+        segment = segment.strip()
+        if not segment:
+            return
+
+        tokens = segment.split()
+        if len(tokens) < 3:
+            return
+        try:
+            var = int(tokens[0])
+            type_val = int(tokens[1])
+        except ValueError:
+            return
+
+        token_list = tokens[2:]
+        if var == 256:
+            self.log_header = token_list
+        elif var == 257:
+            self.log_raw_data.extend(token_list)
+        elif var == 266:
+            self.tree_header = token_list
+        elif var == 267:
+            self.tree_raw_data.extend(token_list)
+
+    def _scan_records(self, buf, encoding: str) -> None:
+        """Walk the records of an ASCII-compatible buffer with ``find(b"~")``.
+
+        The variable number is read from the raw bytes, so only the header
+        and data records (see ``TABLE_VARS``) are ever decoded; the rest of
+        the file is never turned into ``str``.
+        """
+        size = len(buf)
+        pos = 0
+        last_step = -1
+        while True:
+            end = buf.find(b"~", pos)
+            if end < 0:
+                end = size
+            step = pos * 10 // size
+            if step != last_step:
+                self.progressChanged.emit((pos / size) * 100)
+                last_step = step
+
+            seg = buf[pos:end]
+            head = seg.split(None, 2)
+            try:
+                var = int(head[0])
+                int(head[1])
+                keyed = len(head) == 3
+            except (ValueError, IndexError):
+                keyed = False
+            # 숫자 키가 바이트에서 바로 읽히고 관심 없는 변수면 디코딩하지 않음
+            if not keyed or var in self.TABLE_VARS:
+                self._take_segment(str(seg, encoding, "replace"))
+
+            if end >= size:
+                break
+            pos = end + 1
+
     def parse_file(self, file_path: str) -> bool:
         try:
             self.tree_header = []
             self.tree_raw_data = []
             self.log_header = []
             self.log_raw_data = []
+            self._tree_rows = None
+            self._log_rows = None
 
             self.file_info["file_name"] = os.path.basename(file_path)
             self.file_info["file_size"] = os.path.getsize(file_path) / 1024  # KB
 
-            with open(file_path, "rb") as f:
-                content = f.read()
-
-            # 앞부분만 사용해 인코딩을 추정
-            sample = content[:4000]
-            encoding = chardet.detect(sample).get("encoding") or "utf-8"
-            decoded_content = content.decode(encoding, errors="replace")
-
-            segments = decoded_content.split("~")
-            total = len(segments)
             self.progressChanged.emit(0)
-
-            for i, segment in enumerate(segments):
-                if i % max(1, total // 10) == 0:
-                    self.progressChanged.emit((i / total) * 100)
-
-                segment = segment.strip()
-                if not segment:
-                    continue
-
-                tokens = segment.split()
-                if len(tokens) < 3:
-                    continue
-                try:
-                    var = int(tokens[0])
-                    type_val = int(tokens[1])
-                except ValueError:
-                    continue
-
-                token_list = tokens[2:]
-                if var == 256:
-                    self.log_header = token_list
-                elif var == 257:
-                    self.log_raw_data.extend(token_list)
-                elif var == 266:
-                    self.tree_header = token_list
-                elif var == 267:
-                    self.tree_raw_data.extend(token_list)
+            with open(file_path, "rb") as f:
+                if os.fstat(f.fileno()).st_size > 0:
+                    # 파일 전체를 힙에 복사하지 않고 매핑된 버퍼에서 바로 처리
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        # 앞부분만 사용해 인코딩을 추정 (7-bit ASCII 면 검출기 생략)
+                        sample = mm[:4000]
+                        if b"\x00" not in sample and sample.isascii():
+                            encoding = "latin-1"
+                        else:
+                            detect = cchardet.detect if cchardet is not None else chardet.detect
+                            encoding = detect(sample).get("encoding") or "utf-8"
+                        if is_ascii_safe(encoding):
+                            self._scan_records(mm, encoding)
+                        else:
+                            # UTF-16 등은 '~' 가 한 바이트가 아니므로 전체를 디코딩 후 분할
+                            segments = str(mm, encoding, "replace").split("~")
+                            total = len(segments)
+                            for i, segment in enumerate(segments):
+                                if i % max(1, total // 10) == 0:
+                                    self.progressChanged.emit((i / total) * 100)
+                                self._take_segment(segment)
 
             self.progressChanged.emit(100)
             
@@ -244,6 +313,8 @@ class PRIParser(QtCore.QObject):
             
             self.file_info['tree_count'] = len(tree_rows)
             self.file_info['log_count'] = len(log_rows)
+            self._tree_rows = tree_rows
+            self._log_rows = log_rows
             
             self.parsingFinished.emit(True)
             return True
@@ -261,9 +332,10 @@ class PRIParser(QtCore.QObject):
         
         mapped_tree_header = [self.tree_header_map.get(h, h) for h in self.tree_header]
         
-        tree_rows = self._build_table(mapped_tree_header, self.tree_raw_data)
-        
-        tree_rows = self._process_coordinates(tree_rows, mapped_tree_header)
+        tree_rows = self._tree_rows
+        if tree_rows is None:
+            tree_rows = self._build_table(mapped_tree_header, self.tree_raw_data)
+            tree_rows = self._process_coordinates(tree_rows, mapped_tree_header)
         
         df = pd.DataFrame(tree_rows, columns=mapped_tree_header)
         
@@ -279,7 +351,9 @@ class PRIParser(QtCore.QObject):
 
         mapped_log_header = [self.log_header_map.get(h, h) for h in self.log_header]
 
-        log_rows = self._build_table(mapped_log_header, self.log_raw_data)
+        log_rows = self._log_rows
+        if log_rows is None:
+            log_rows = self._build_table(mapped_log_header, self.log_raw_data)
 
         df = pd.DataFrame(log_rows, columns=mapped_log_header)
         